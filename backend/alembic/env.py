@@ -7,7 +7,7 @@ using the application's database settings.
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import event, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -15,7 +15,7 @@ from alembic import context
 
 # Import application config and models
 from app.config import settings
-from app.database import Base
+from app.database import Base, set_sqlite_pragmas
 
 # Import all models to ensure they are registered with Base.metadata
 from app.models import (  # noqa: F401
@@ -93,6 +93,9 @@ async def run_async_migrations() -> None:
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
+    if connectable.dialect.name == "sqlite":
+        # Same WAL / fsync tuning as the app's engine
+        event.listen(connectable.sync_engine, "connect", set_sqlite_pragmas)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
@@ -17,6 +17,9 @@ down_revision: Union[str, None] = "8f3d2e1a9b7c"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per backfill transaction on the users table
+BACKFILL_BATCH_SIZE = 10_000
+
 
 def upgrade() -> None:
     # Create reading_articles table
@@ -56,18 +59,69 @@ def upgrade() -> None:
         op.f("ix_reading_articles_user_id"), "reading_articles", ["user_id"], unique=False
     )
 
-    # Add reminder fields to users table
-    op.add_column(
-        "users",
-        sa.Column("reminder_enabled", sa.Boolean(), nullable=False, server_default="0"),
-    )
-    op.add_column(
-        "users",
-        sa.Column(
-            "reminder_time", sa.String(length=5), nullable=True, server_default="09:00"
-        ),
+    # Add reminder fields to users table.
+    # Columns are added as nullable without a default so the ALTER is a
+    # metadata-only change, then existing rows are backfilled in bounded
+    # batches before the constraints are tightened.
+    op.add_column("users", sa.Column("reminder_enabled", sa.Boolean(), nullable=True))
+    op.add_column("users", sa.Column("reminder_time", sa.String(length=5), nullable=True))
+
+    _backfill_in_batches("reminder_enabled", False)
+    _backfill_in_batches("reminder_time", "09:00")
+
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.alter_column(
+            "reminder_enabled",
+            existing_type=sa.Boolean(),
+            nullable=False,
+            server_default="0",
+        )
+        batch_op.alter_column(
+            "reminder_time",
+            existing_type=sa.String(length=5),
+            nullable=True,
+            server_default="09:00",
+        )
+
+
+def _backfill_in_batches(column: str, value) -> None:
+    """Fill NULLs in a users column in row_number() windows, committing per batch."""
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+    index_name = f"ix_users_{column}_backfill"
+
+    update_batch = sa.text(
+        f"UPDATE users SET {column} = :value WHERE id IN ("
+        "SELECT id FROM ("
+        "SELECT id, row_number() OVER (ORDER BY id) AS rn FROM users"
+        ") t WHERE t.rn BETWEEN :lo AND :hi"
+        f") AND {column} IS NULL"
     )
 
+    with op.get_context().autocommit_block():
+        if is_postgres:
+            # Short-lived partial index so each batch finds its NULL rows cheaply
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON users (id) WHERE {column} IS NULL"
+            )
+
+        total = bind.execute(sa.text("SELECT COUNT(*) FROM users")).scalar() or 0
+        for lo in range(1, total + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                update_batch,
+                {"value": value, "lo": lo, "hi": lo + BACKFILL_BATCH_SIZE - 1},
+            )
+
+        # Catch rows inserted while the batches were running
+        bind.execute(
+            sa.text(f"UPDATE users SET {column} = :value WHERE {column} IS NULL"),
+            {"value": value},
+        )
+
+        if is_postgres:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
 
 def downgrade() -> None:
     # Remove reminder fields from users table
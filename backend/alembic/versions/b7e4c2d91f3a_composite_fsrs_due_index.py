@@ -0,0 +1,42 @@
+"""composite_fsrs_due_index
+
+Revision ID: b7e4c2d91f3a
+Revises: 700e7f3b59a3
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2d91f3a'
+down_revision: Union[str, Sequence[str], None] = '700e7f3b59a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the single-column fsrs_due index with a per-user partial one.
+
+    Due-word queries always filter on user_id first, and only scheduled cards
+    (fsrs_due IS NOT NULL) can match "fsrs_due <= now", so the index is keyed
+    on (user_id, fsrs_due) and skips never-reviewed rows.
+    """
+    with op.batch_alter_table('user_wordlist', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_wordlist_fsrs_due')
+        batch_op.create_index(
+            'ix_user_wordlist_fsrs_due_active',
+            ['user_id', 'fsrs_due'],
+            postgresql_where=sa.text('fsrs_due IS NOT NULL'),
+            sqlite_where=sa.text('fsrs_due IS NOT NULL'),
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column fsrs_due index."""
+    with op.batch_alter_table('user_wordlist', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_wordlist_fsrs_due_active')
+        batch_op.create_index('ix_user_wordlist_fsrs_due', ['fsrs_due'])
@@ -0,0 +1,37 @@
+"""reading_articles_keyset_index
+
+Revision ID: c3a9f1e27b54
+Revises: b7e4c2d91f3a
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9f1e27b54'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c2d91f3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index a user's articles by (created_at, id) for keyset pagination.
+
+    Article lists seek with (created_at, id) < cursor ordered newest first;
+    a b-tree on (user_id, created_at, id) serves that as a backward range scan.
+    """
+    with op.batch_alter_table('reading_articles', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_reading_articles_user_created',
+            ['user_id', 'created_at', 'id'],
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    with op.batch_alter_table('reading_articles', schema=None) as batch_op:
+        batch_op.drop_index('ix_reading_articles_user_created')
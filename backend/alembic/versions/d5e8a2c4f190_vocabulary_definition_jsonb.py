@@ -0,0 +1,51 @@
+"""vocabulary_definition_jsonb
+
+Revision ID: d5e8a2c4f190
+Revises: c3a9f1e27b54
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a2c4f190'
+down_revision: Union[str, Sequence[str], None] = 'c3a9f1e27b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store vocabulary definitions as JSONB on PostgreSQL.
+
+    SQLite keeps JSON as text, which is what the column already holds, so
+    only PostgreSQL needs the column rewritten.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'vocabulary_cache',
+        'definition_json',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using='definition_json::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Store vocabulary definitions as text again."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'vocabulary_cache',
+        'definition_json',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='definition_json::text',
+    )
@@ -1,40 +1,66 @@
 """Admin API endpoints."""
 
+import asyncio
+from contextlib import aclosing
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.api.deps import CurrentUser, DbSession, get_current_admin_user
-from app.database import get_db
-from app.llm.factory import LLMServiceError
+from app.database import async_session_maker
+from app.llm.factory import LLMFactory, LLMServiceError, invalidate_llm_config
+from app.llm.game_question_agent import GameQuestionAgent
 from app.models.user import User
 from app.schemas.notification import BroadcastRequest
+from app.services.ai_settings_service import AISettingsService
 from app.services.game_question_service import GameQuestionService
 from app.services.notification_service import NotificationService
 from app.services.vocabulary_service import VocabularyService
+from app.utils.async_ttl_cache import async_ttl_cache
+from app.utils.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(get_current_admin_user)])
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    dependencies=[Depends(get_current_admin_user)],
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
 # Game Questions
 # =============================================================================
 
+_SUPPORTED_GAME_TYPES = frozenset(GameQuestionAgent.SUPPORTED_GAME_TYPES)
+
+
 class GenerateQuestionsRequest(BaseModel):
     """Request to generate new game questions."""
 
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True, cache_strings="all")
+
     game_type: str = Field(
-        ..., description="Type of game: clarity, transitions, brevity, context, diction, punctuation, listening, speed_reading, word_parts, rocket, rephrase, recall, attention"
+        ..., description="Type of game: clarity, transitions, brevity, context, diction, punctuation, listening, speed_reading, word_parts, rocket, rephrase, recall, attention, pronunciation"
     )
     count: int = Field(default=5, ge=1, le=20, description="Number of questions")
     difficulty: str = Field(default="medium", description="Difficulty level")
 
+    @field_validator("game_type")
+    @classmethod
+    def check_game_type(cls, value: str) -> str:
+        if value not in _SUPPORTED_GAME_TYPES:
+            raise ValueError(f"Unsupported game type: {value}")
+        return value
+
 
 class GenerateQuestionsResponse(BaseModel):
     """Response from question generation."""
 
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True, cache_strings="all")
+
     generated: int
     game_type: str
     questions: list
@@ -43,7 +69,7 @@ class GenerateQuestionsResponse(BaseModel):
 @router.post("/questions/generate", response_model=GenerateQuestionsResponse)
 async def generate_questions(
     request: GenerateQuestionsRequest,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """
     Generate new game questions using AI.
@@ -67,15 +93,51 @@ async def generate_questions(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": "VALIDATION_ERROR", "detail": str(e)},
         )
+
+
+@router.post("/questions/generate/stream")
+async def generate_questions_stream(
+    request: GenerateQuestionsRequest,
+    db: DbSession,
+):
+    """
+    Generate new game questions using AI, streamed as NDJSON.
+
+    Each line is one saved question as soon as the LLM has produced it. If
+    generation fails part-way, a final {"error": ..., "detail": ...} line is sent.
+    """
+    service = GameQuestionService(db)
+    questions = service.stream_questions(
+        game_type=request.game_type,
+        count=request.count,
+        difficulty=request.difficulty,
+    )
+
+    # Wait for the first question so configuration errors still map to HTTP errors
+    try:
+        first = await anext(questions, None)
     except LLMServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"error": "LLM_SERVICE_ERROR", "detail": str(e.message)},
         )
 
+    async def ndjson_lines():
+        async with aclosing(questions):
+            if first is None:
+                return
+            yield orjson.dumps(first) + b"\n"
+            try:
+                async for question in questions:
+                    yield orjson.dumps(question) + b"\n"
+            except LLMServiceError as e:
+                yield orjson.dumps({"error": "LLM_SERVICE_ERROR", "detail": str(e.message)}) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 
 @router.get("/questions/stats")
-async def get_question_stats(db: AsyncSession = Depends(get_db)):
+async def get_question_stats(db: DbSession):
     """Get statistics about stored questions."""
     service = GameQuestionService(db)
     stats = await service.get_question_stats()
@@ -85,8 +147,8 @@ async def get_question_stats(db: AsyncSession = Depends(get_db)):
 @router.patch("/questions/{question_id}/review")
 async def mark_question_reviewed(
     question_id: int,
+    db: DbSession,
     reviewed: bool = Query(default=True),
-    db: AsyncSession = Depends(get_db),
 ):
     """Mark a question as reviewed (or unreviewed)."""
     service = GameQuestionService(db)
@@ -104,7 +166,7 @@ async def mark_question_reviewed(
 @router.delete("/questions/{question_id}")
 async def delete_question(
     question_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Delete a generated question."""
     service = GameQuestionService(db)
@@ -122,8 +184,8 @@ async def delete_question(
 @router.patch("/questions/{question_id}")
 async def update_question(
     question_id: int,
+    db: DbSession,
     updates: dict = Body(...),
-    db: AsyncSession = Depends(get_db),
 ):
     """Update a generated question."""
     service = GameQuestionService(db)
@@ -162,25 +224,48 @@ async def broadcast_notification(
 # Vocabulary
 # =============================================================================
 
+# Admin dashboard polls these; serve repeated reads from memory for a few seconds
+STATS_CACHE_TTL_SECONDS = 5.0
+
+
+@async_ttl_cache(STATS_CACHE_TTL_SECONDS, key=lambda db: ())
+async def _cached_cache_stats(db) -> dict:
+    return await VocabularyService(db).get_cache_stats()
+
+
 @router.get("/vocabulary/cache-stats")
-async def get_cache_stats(db: AsyncSession = Depends(get_db)):
+async def get_cache_stats(db: DbSession):
     """Get vocabulary cache statistics."""
-    service = VocabularyService(db)
-    return await service.get_cache_stats()
+    return await _cached_cache_stats(db)
 
 
 # =============================================================================
 # AI Settings
 # =============================================================================
 
+_ALLOWED_PROVIDERS = frozenset(LLMFactory.SUPPORTED_PROVIDERS)
+
+
+def _validate_provider_type(value: str) -> str:
+    """Check provider_type against the supported providers (set lookup, no regex)."""
+    if value not in _ALLOWED_PROVIDERS:
+        raise ValueError(f"provider_type must be one of: {', '.join(sorted(_ALLOWED_PROVIDERS))}")
+    return value
+
+
 class CreateProviderRequest(BaseModel):
     """Request to create a new AI provider."""
     name: str = Field(..., min_length=1, max_length=100)
-    provider_type: str = Field(..., pattern="^(gemini|mistral)$")
+    provider_type: str
     api_key: str = Field(..., min_length=1)
     model: Optional[str] = None
     set_active: bool = False
 
+    @field_validator("provider_type")
+    @classmethod
+    def check_provider_type(cls, value: str) -> str:
+        return _validate_provider_type(value)
+
 
 class UpdateProviderRequest(BaseModel):
     """Request to update an AI provider."""
@@ -191,14 +276,18 @@ class UpdateProviderRequest(BaseModel):
 
 class TestConnectionRequest(BaseModel):
     """Request to test AI provider connection."""
-    provider_type: str = Field(..., pattern="^(gemini|mistral)$")
+    provider_type: str
     api_key: str = Field(..., min_length=1)
 
+    @field_validator("provider_type")
+    @classmethod
+    def check_provider_type(cls, value: str) -> str:
+        return _validate_provider_type(value)
+
 
 @router.get("/ai-providers")
-async def list_providers(db: AsyncSession = Depends(get_db)):
+async def list_providers(db: DbSession):
     """List all AI providers."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     providers = await service.get_providers()
     return {
@@ -209,10 +298,9 @@ async def list_providers(db: AsyncSession = Depends(get_db)):
 @router.post("/ai-providers")
 async def create_provider(
     request: CreateProviderRequest,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Create a new AI provider configuration."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     
     provider = await service.create_provider(
@@ -222,6 +310,7 @@ async def create_provider(
         model=request.model,
         set_active=request.set_active,
     )
+    _provider_settings_changed()
     
     return {
         "success": True,
@@ -229,21 +318,29 @@ async def create_provider(
     }
 
 
+@async_ttl_cache(STATS_CACHE_TTL_SECONDS, key=lambda db: ())
+async def _cached_provider_status(db) -> dict:
+    return await AISettingsService(db).get_provider_status()
+
+
+def _provider_settings_changed() -> None:
+    """Drop cached provider state after an AI provider is changed."""
+    _cached_provider_status.cache_clear()
+    invalidate_llm_config()
+
+
 @router.get("/ai-providers/status")
-async def get_provider_status(db: AsyncSession = Depends(get_db)):
+async def get_provider_status(db: DbSession):
     """Get current AI provider status."""
-    from app.services.ai_settings_service import AISettingsService
-    service = AISettingsService(db)
-    return await service.get_provider_status()
+    return await _cached_provider_status(db)
 
 
 @router.post("/ai-providers/test")
 async def test_connection(
     request: TestConnectionRequest,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Test connection to an AI provider."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     return await service.test_connection(request.provider_type, request.api_key)
 
@@ -251,10 +348,9 @@ async def test_connection(
 @router.get("/ai-providers/{provider_id}")
 async def get_provider(
     provider_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Get a specific AI provider."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     
     provider = await service.get_provider(provider_id)
@@ -271,10 +367,9 @@ async def get_provider(
 async def update_provider(
     provider_id: int,
     request: UpdateProviderRequest,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Update an AI provider configuration."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     
     provider = await service.update_provider(
@@ -283,6 +378,7 @@ async def update_provider(
         api_key=request.api_key,
         model=request.model,
     )
+    _provider_settings_changed()
     
     if not provider:
         raise HTTPException(
@@ -299,13 +395,13 @@ async def update_provider(
 @router.delete("/ai-providers/{provider_id}")
 async def delete_provider(
     provider_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Delete an AI provider."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     
     success = await service.delete_provider(provider_id)
+    _provider_settings_changed()
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -318,13 +414,13 @@ async def delete_provider(
 @router.post("/ai-providers/{provider_id}/activate")
 async def activate_provider(
     provider_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: DbSession,
 ):
     """Set a provider as the active one."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
     
     provider = await service.set_active_provider(provider_id)
+    _provider_settings_changed()
     if not provider:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -340,20 +436,24 @@ async def activate_provider(
 @router.get("/ai-providers/{provider_id}/usage")
 async def get_provider_usage(
     provider_id: int,
+    db: DbSession,
     days: int = Query(default=30, ge=1, le=365),
-    db: AsyncSession = Depends(get_db),
 ):
     """Get usage statistics for a provider."""
-    from app.services.ai_settings_service import AISettingsService
     service = AISettingsService(db)
-    
-    provider = await service.get_provider(provider_id)
+
+    async def usage_stats() -> dict:
+        # AsyncSession isn't safe for concurrent use, so the stats query
+        # runs on its own short-lived session
+        async with async_session_maker() as stats_db:
+            return await AISettingsService(stats_db).get_usage_stats(provider_id, days)
+
+    provider, stats = await asyncio.gather(service.get_provider(provider_id), usage_stats())
     if not provider:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": "NOT_FOUND", "detail": "Provider not found"},
         )
     
-    stats = await service.get_usage_stats(provider_id, days)
     return stats
 
@@ -1,24 +1,29 @@
 """Conversation API endpoints."""
 
+import hashlib
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_optional
+from app.api.deps import get_current_user_id_optional
 from app.database import get_db
 from app.llm.conversation_agent import (
     ConversationAgent,
-    add_message,
+    add_exchange,
     create_session,
-    get_session,
-    get_session_context,
     get_available_scenarios,
-    get_scenario_opening,
     get_scenario_data,
+    get_session_full,
 )
-from app.llm.factory import LLMFactory, LLMServiceError, get_active_llm_config
-from app.models.user import User
+from app.llm.factory import (
+    LLMFactory,
+    LLMServiceError,
+    get_active_llm_config,
+    get_llm_config_version,
+)
+from app.llm.response_cache import cache_opening, cache_reply, get_cached_opening, get_cached_reply
 from app.schemas.conversation import (
     ConversationFeedbackRequest,
     ConversationFeedbackResponse,
@@ -30,8 +35,25 @@ from app.schemas.conversation import (
     ScenariosListResponse,
 )
 from app.services.wordlist_service import WordlistService
+from app.utils.cache import TTLCache
+from app.utils.responses import ORJSONResponse
+from app.utils.sse import SSE_DONE, sse_event
+
+router = APIRouter(
+    prefix="/api/conversation",
+    tags=["conversation"],
+    default_response_class=ORJSONResponse,
+)
+
 
-router = APIRouter(prefix="/api/conversation", tags=["conversation"])
+# Agents are stateless between requests, so one per (provider, model, key) is reused
+_agent_cache = TTLCache(maxsize=128, ttl=3600)
+
+
+def _agent_cache_key(provider: Optional[str], api_key: Optional[str], model: Optional[str]) -> str:
+    """Hash the agent configuration so raw API keys are never held as cache keys."""
+    raw = f"{get_llm_config_version()}|{provider}|{model}|{api_key}"
+    return hashlib.sha256(raw.encode()).hexdigest()
 
 
 async def get_conversation_agent(
@@ -50,17 +72,20 @@ async def get_conversation_agent(
     """
     try:
         # If user provides custom API key, use that
-        if api_key:
-            llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
-        else:
+        if not api_key:
             # Use DB-configured or ENV fallback
             config = await get_active_llm_config(db)
-            llm = LLMFactory.create(
-                provider=config["provider_type"],
-                api_key=config["api_key"],
-                model=config.get("model") or model,
-            )
-        return ConversationAgent(llm=llm)
+            provider = config["provider_type"]
+            api_key = config["api_key"]
+            model = config.get("model") or model
+
+        key = _agent_cache_key(provider, api_key, model)
+        agent = _agent_cache.get(key)
+        if agent is None:
+            llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
+            agent = ConversationAgent(llm=llm)
+            _agent_cache.set(key, agent)
+        return agent
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,12 +93,93 @@ async def get_conversation_agent(
         )
 
 
+# Scenarios are static, so the list response is serialized once at import
+_SCENARIOS_RESPONSE_JSON = ScenariosListResponse(
+    scenarios=[ScenarioInfo(**s) for s in get_available_scenarios()]
+).model_dump_json().encode()
+
+
 @router.get("/scenarios", response_model=ScenariosListResponse)
 async def list_scenarios():
     """Get list of available conversation scenarios for role-play practice."""
-    scenarios = get_available_scenarios()
-    return ScenariosListResponse(
-        scenarios=[ScenarioInfo(**s) for s in scenarios]
+    return Response(content=_SCENARIOS_RESPONSE_JSON, media_type="application/json")
+
+
+async def _begin_conversation(
+    request: Optional[ConversationStartRequest],
+    db: AsyncSession,
+    current_user_id: Optional[int],
+    agent: ConversationAgent,
+) -> tuple[dict, Optional[list[str]]]:
+    """
+    Resolve the settings of a new conversation.
+
+    Returns the ConversationStartResponse fields, and the target words to
+    store in the session context. "session_id" is filled in by
+    _create_started_session once the opening is known; "opening_message" is
+    None when no predefined or cached opening applies and one has to be
+    generated.
+    """
+    # Extract options from request
+    topic = request.topic if request else None
+    target_words = request.target_words if request else None
+    scenario = request.scenario if request else None
+    
+    # Scenario-specific handling
+    scenario_name = None
+    user_role = None
+    user_goal = None
+    opening_message = None
+    
+    if scenario:
+        scenario_data = get_scenario_data(scenario)
+        if scenario_data:
+            scenario_name = scenario_data.get("name")
+            user_role = scenario_data.get("user_role")
+            user_goal = scenario_data.get("user_goal")
+            target_words = scenario_data.get("vocabulary", [])
+            # Use predefined scenario opening
+            opening_message = scenario_data.get("opening")
+        else:
+            scenario = None  # Invalid scenario, fall back to normal mode
+    
+    # The session keeps the requested words, not auto-selected ones
+    session_words = target_words
+    
+    # Generate opening if not using scenario (or scenario opening failed)
+    if not scenario or not opening_message:
+        # If user is authenticated and no words provided, auto-select from wordlist
+        if current_user_id and not target_words:
+            wordlist_service = WordlistService(db)
+            practice_words = await wordlist_service.get_practice_words(
+                user_id=current_user_id,
+                count=3,
+            )
+            if practice_words:
+                target_words = practice_words
+        
+        opening_message = await get_cached_opening(agent.llm, topic, target_words)
+
+    start = {
+        "session_id": None,
+        "opening_message": opening_message,
+        "topic": topic,
+        "target_words": target_words,
+        "scenario": scenario,
+        "scenario_name": scenario_name,
+        "user_role": user_role,
+        "user_goal": user_goal,
+    }
+    return start, session_words
+
+
+async def _create_started_session(start: dict, session_words: Optional[list[str]]) -> None:
+    """Create the session, with the opening message as its first entry."""
+    start["session_id"] = await create_session(
+        topic=start["topic"],
+        target_words=session_words,
+        scenario=start["scenario"],
+        opening_message=start["opening_message"],
     )
 
 
@@ -81,7 +187,7 @@ async def list_scenarios():
 async def start_conversation(
     request: ConversationStartRequest = None,
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user_id: Optional[int] = Depends(get_current_user_id_optional),
     agent: ConversationAgent = Depends(get_conversation_agent),
 ):
     """
@@ -92,147 +198,197 @@ async def start_conversation(
     If scenario is provided, uses predefined scenario settings.
     If user is authenticated, words may be auto-selected from their word list.
     """
-    try:
-        # Extract options from request
-        topic = request.topic if request else None
-        target_words = request.target_words if request else None
-        scenario = request.scenario if request else None
-        
-        # Scenario-specific handling
-        scenario_name = None
-        user_role = None
-        user_goal = None
-        
-        if scenario:
-            scenario_data = get_scenario_data(scenario)
-            if scenario_data:
-                scenario_name = scenario_data.get("name")
-                user_role = scenario_data.get("user_role")
-                user_goal = scenario_data.get("user_goal")
-                target_words = scenario_data.get("vocabulary", [])
-                # Use predefined scenario opening
-                opening_message = get_scenario_opening(scenario)
-            else:
-                scenario = None  # Invalid scenario, fall back to normal mode
-        
-        # Create session with scenario support
-        session_id = create_session(topic=topic, target_words=target_words, scenario=scenario)
-        
-        # Generate opening if not using scenario (or scenario opening failed)
-        if not scenario or not opening_message:
-            # If user is authenticated and no words provided, auto-select from wordlist
-            if current_user and not target_words:
-                wordlist_service = WordlistService(db)
-                random_words = await wordlist_service.get_random_words(
-                    user_id=current_user.id,
-                    count=3,
-                    max_mastery=70,
-                )
-                if random_words:
-                    target_words = [w["word"] for w in random_words]
-            
-            opening_message = await agent.generate_opening(topic=topic, target_words=target_words)
-
-        # Add opening message to session history
-        add_message(session_id, "assistant", opening_message)
-
-        return ConversationStartResponse(
-            session_id=session_id,
-            opening_message=opening_message,
-            topic=topic,
-            target_words=target_words,
-            scenario=scenario,
-            scenario_name=scenario_name,
-            user_role=user_role,
-            user_goal=user_goal,
-        )
+    start, session_words = await _begin_conversation(request, db, current_user_id, agent)
 
-    except LLMServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "error": "LLM_SERVICE_ERROR",
-                "detail": str(e.message),
-                "code": "LLM_SERVICE_ERROR",
-            },
+    if start["opening_message"] is None:
+        start["opening_message"] = await agent.generate_opening(
+            topic=start["topic"], target_words=start["target_words"]
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "INTERNAL_ERROR",
-                "detail": "An unexpected error occurred",
-                "code": "INTERNAL_ERROR",
-            },
+        await cache_opening(
+            agent.llm, start["topic"], start["target_words"], start["opening_message"]
         )
 
+    await _create_started_session(start, session_words)
+
+    return ConversationStartResponse(**start)
+
+
+@router.post("/start/stream")
+async def start_conversation_stream(
+    request: ConversationStartRequest = None,
+    db: AsyncSession = Depends(get_db),
+    current_user_id: Optional[int] = Depends(get_current_user_id_optional),
+    agent: ConversationAgent = Depends(get_conversation_agent),
+):
+    """
+    Start a new conversation session, streaming the opening message via SSE.
+
+    Takes the same options as /start. Events are {"type": "opening", "delta": ...}
+    chunks of the opening message, then {"type": "done", ...} carrying the
+    same fields as the /start response, then [DONE].
+    """
+    # Session setup uses the DB, so it completes before the stream starts
+    start, session_words = await _begin_conversation(request, db, current_user_id, agent)
+
+    async def generate_stream():
+        try:
+            opening_message = start["opening_message"]
+            if opening_message is not None:
+                yield sse_event({"type": "opening", "delta": opening_message})
+            else:
+                parts = []
+                async for delta in agent.stream_opening(
+                    topic=start["topic"], target_words=start["target_words"]
+                ):
+                    parts.append(delta)
+                    yield sse_event({"type": "opening", "delta": delta})
+                opening_message = start["opening_message"] = "".join(parts).strip()
+                await cache_opening(agent.llm, start["topic"], start["target_words"], opening_message)
+
+            await _create_started_session(start, session_words)
+
+            yield sse_event({"type": "done", **start})
+            yield SSE_DONE
+
+        except LLMServiceError as e:
+            yield sse_event({"error": "LLM_SERVICE_ERROR", "detail": str(e.message)})
+        except Exception:
+            yield sse_event({"error": "INTERNAL_ERROR", "detail": "An unexpected error occurred"})
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
 
-@router.post("/message", response_model=ConversationResponse)
+@router.post(
+    "/message",
+    response_model=None,
+    responses={200: {"model": ConversationResponse}},
+)
 async def send_message(
     request: ConversationMessageRequest,
+    background_tasks: BackgroundTasks,
     agent: ConversationAgent = Depends(get_conversation_agent),
 ):
     """
     Send a message and receive a response.
 
     If no session_id is provided, a new session will be created.
+    History and reply-cache writes run after the response has been sent.
     """
-    try:
-        # Get or create session
-        session_id = request.session_id
-        if not session_id:
-            session_id = create_session()
-
-        # Get conversation history and context
-        history = get_session(session_id)
-        context = get_session_context(session_id)
-        target_words = context.get("target_words", [])
-
-        # Process message with target_words in state
+    # Get or create session
+    session_id = request.session_id
+    if not session_id:
+        session_id = await create_session()
+
+    # Get conversation history and context
+    history, context = await get_session_full(session_id)
+    target_words = context.get("target_words", [])
+
+    # Process message with target_words in state, reusing an identical earlier reply
+    scenario = context.get("scenario")
+    result = await get_cached_reply(agent.llm, request.message, history, target_words, scenario)
+    if result is None:
         result = await agent.process_message(
             request.message, history, target_words=target_words
         )
-
-        # Add user message to history
-        add_message(
-            session_id,
-            "user",
-            request.message,
-            result.get("correction"),
+        background_tasks.add_task(
+            cache_reply, agent.llm, request.message, history, target_words, scenario, result
         )
 
-        # Add assistant reply to history
-        full_reply = result["reply"]
-        if result.get("followUp"):
-            full_reply = f"{result['reply']} {result['followUp']}"
+    # Add user message and assistant reply to history
+    full_reply = result["reply"]
+    if result.get("followUp"):
+        full_reply = f"{result['reply']} {result['followUp']}"
 
-        add_message(session_id, "assistant", full_reply)
+    background_tasks.add_task(
+        add_exchange, session_id, request.message, full_reply, result.get("correction")
+    )
 
-        return ConversationResponse(
-            reply=result["reply"],
-            followUp=result.get("followUp", ""),
-            correction=result.get("correction"),
-            session_id=session_id,
-        )
+    # Built as a plain dict: the agent output is already well-formed, so
+    # skip response-model re-validation and serialize straight with orjson
+    return ORJSONResponse({
+        "reply": result["reply"],
+        "followUp": result.get("followUp", ""),
+        "correction": result.get("correction"),
+        "session_id": session_id,
+    })
 
-    except LLMServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "error": "LLM_SERVICE_ERROR",
-                "detail": str(e.message),
-                "code": "LLM_SERVICE_ERROR",
-            },
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "INTERNAL_ERROR",
-                "detail": "An unexpected error occurred",
-                "code": "INTERNAL_ERROR",
-            },
-        )
+
+@router.post("/message/stream")
+async def send_message_stream(
+    request: ConversationMessageRequest,
+    agent: ConversationAgent = Depends(get_conversation_agent),
+):
+    """
+    Send a message and stream the response using Server-Sent Events.
+
+    Each event carries a JSON object: {"type": "reply"|"followUp", "delta": ...}
+    chunks while the reply is generated, then a final {"type": "done", ...}
+    with the full reply, follow-up, correction and session ID, then [DONE].
+    If no session_id is provided, a new session will be created.
+    """
+
+    async def generate_stream():
+        try:
+            # Get or create session
+            session_id = request.session_id
+            if not session_id:
+                session_id = await create_session()
+
+            history, context = await get_session_full(session_id)
+            target_words = context.get("target_words", [])
+            scenario = context.get("scenario")
+
+            result = await get_cached_reply(agent.llm, request.message, history, target_words, scenario)
+            if result is not None:
+                yield sse_event({"type": "reply", "delta": result["reply"]})
+                if result.get("followUp"):
+                    yield sse_event({"type": "followUp", "delta": result["followUp"]})
+            else:
+                async for event in agent.stream_message(
+                    request.message, history, target_words=target_words
+                ):
+                    if event["type"] == "done":
+                        result = {k: v for k, v in event.items() if k != "type"}
+                    else:
+                        yield sse_event(event)
+                await cache_reply(agent.llm, request.message, history, target_words, scenario, result)
+
+            full_reply = result["reply"]
+            if result.get("followUp"):
+                full_reply = f"{result['reply']} {result['followUp']}"
+            await add_exchange(session_id, request.message, full_reply, result.get("correction"))
+
+            yield sse_event({
+                "type": "done",
+                "reply": result["reply"],
+                "followUp": result.get("followUp", ""),
+                "correction": result.get("correction"),
+                "session_id": session_id,
+            })
+            yield SSE_DONE
+
+        except LLMServiceError as e:
+            yield sse_event({"error": "LLM_SERVICE_ERROR", "detail": str(e.message)})
+        except Exception:
+            yield sse_event({"error": "INTERNAL_ERROR", "detail": "An unexpected error occurred"})
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @router.post("/feedback", response_model=ConversationFeedbackResponse)
@@ -245,49 +401,24 @@ async def get_feedback(
 
     Analyzes the conversation and provides improvement suggestions.
     """
-    try:
-        # Get conversation history and context first (before creating agent)
-        history = get_session(request.session_id)
-        context = get_session_context(request.session_id)
-        target_words = context.get("target_words", [])
-
-        if not history:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "SESSION_NOT_FOUND",
-                    "detail": "Conversation session not found or empty",
-                    "code": "SESSION_NOT_FOUND",
-                },
-            )
-
-        # Generate feedback with target words context
+    # Get conversation history and context first (before creating agent)
+    history, context = await get_session_full(request.session_id)
+    target_words = context.get("target_words", [])
 
-        # Generate feedback with target words context
-        feedback = await agent.generate_feedback(history, target_words=target_words)
-
-        return ConversationFeedbackResponse(
-            feedback=feedback,
-            session_id=request.session_id,
-        )
-
-    except HTTPException:
-        raise
-    except LLMServiceError as e:
+    if not history:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail={
-                "error": "LLM_SERVICE_ERROR",
-                "detail": str(e.message),
-                "code": "LLM_SERVICE_ERROR",
-            },
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "INTERNAL_ERROR",
-                "detail": "An unexpected error occurred",
-                "code": "INTERNAL_ERROR",
+                "error": "SESSION_NOT_FOUND",
+                "detail": "Conversation session not found or empty",
+                "code": "SESSION_NOT_FOUND",
             },
         )
+
+    # Generate feedback with target words context
+    feedback = await agent.generate_feedback(history, target_words=target_words)
+
+    return ConversationFeedbackResponse(
+        feedback=feedback,
+        session_id=request.session_id,
+    )
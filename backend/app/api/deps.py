@@ -1,5 +1,7 @@
 """API dependencies for dependency injection."""
 
+import hashlib
+import time
 from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
@@ -8,12 +10,47 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
+from app.services.achievement_service import AchievementService
 from app.services.auth_service import AuthenticationError, AuthService
+from app.services.notification_service import NotificationService
+from app.services.progress_service import ProgressService
+from app.services.reading_service import ReadingService
+from app.services.srs_service import SpacedRepetitionService
+from app.utils.cache import TTLCache
 
 # Security scheme for JWT bearer token
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
+# Verified access tokens map to their user id (or the code/message of the
+# AuthenticationError they raised) so repeat requests with the same token skip the signature check.
+# Entries never outlive the token itself.
+TOKEN_CACHE_TTL_SECONDS = 60
+
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+
+def _resolve_user_id(token: str) -> int:
+    """Verify an access token and return its user id, using the token cache."""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(cache_key)
+    if isinstance(cached, tuple):
+        raise AuthenticationError(*cached)
+    if cached is not None:
+        return cached
+
+    try:
+        payload = AuthService.verify_access_token(token)
+        user_id = int(payload.sub)
+    except AuthenticationError as e:
+        _token_cache.set(cache_key, (e.code, e.message))
+        raise
+
+    remaining = payload.exp - time.time()
+    if remaining > 0:
+        _token_cache.set(cache_key, user_id, ttl=min(TOKEN_CACHE_TTL_SECONDS, remaining))
+    return user_id
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -26,9 +63,7 @@ async def get_current_user(
     then retrieves the corresponding user from the database.
     """
     try:
-        token = credentials.credentials
-        payload = AuthService.verify_access_token(token)
-        user_id = int(payload.sub)
+        user_id = _resolve_user_id(credentials.credentials)
         
         user = await AuthService.get_user_by_id(db, user_id)
         if not user:
@@ -59,9 +94,7 @@ async def get_current_user_optional(
         return None
     
     try:
-        token = credentials.credentials
-        payload = AuthService.verify_access_token(token)
-        user_id = int(payload.sub)
+        user_id = _resolve_user_id(credentials.credentials)
         
         user = await AuthService.get_user_by_id(db, user_id)
         return user
@@ -70,9 +103,29 @@ async def get_current_user_optional(
         return None
 
 
+async def get_current_user_id_optional(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security_optional)],
+) -> Optional[int]:
+    """
+    Optional dependency resolving only the user id from the access token.
+
+    Unlike get_current_user_optional it never touches the database, for
+    endpoints that merely personalize by user id. Returns None when no valid
+    token is provided.
+    """
+    if not credentials:
+        return None
+
+    try:
+        return _resolve_user_id(credentials.credentials)
+    except AuthenticationError:
+        return None
+
+
 # Type alias for dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
 OptionalUser = Annotated[Optional[User], Depends(get_current_user_optional)]
+OptionalUserId = Annotated[Optional[int], Depends(get_current_user_id_optional)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
@@ -89,3 +142,30 @@ async def get_current_admin_user(
         )
     return current_user
 
+
+# Request-scoped services bound to the request's database session
+def get_reading_service(db: DbSession) -> ReadingService:
+    return ReadingService(db)
+
+
+def get_notification_service(db: DbSession) -> NotificationService:
+    return NotificationService(db)
+
+
+def get_progress_service(db: DbSession) -> ProgressService:
+    return ProgressService(db)
+
+
+def get_achievement_service(db: DbSession) -> AchievementService:
+    return AchievementService(db)
+
+
+def get_srs_service(db: DbSession) -> SpacedRepetitionService:
+    return SpacedRepetitionService(db)
+
+
+ReadingServiceDep = Annotated[ReadingService, Depends(get_reading_service)]
+NotificationServiceDep = Annotated[NotificationService, Depends(get_notification_service)]
+ProgressServiceDep = Annotated[ProgressService, Depends(get_progress_service)]
+AchievementServiceDep = Annotated[AchievementService, Depends(get_achievement_service)]
+SRSServiceDep = Annotated[SpacedRepetitionService, Depends(get_srs_service)]
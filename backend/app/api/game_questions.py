@@ -8,10 +8,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.services.game_question_service import GameQuestionService
 from app.llm.game_question_agent import GameQuestionAgent
+from app.utils.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/game-questions", tags=["game-questions"])
-
+router = APIRouter(
+    prefix="/api/game-questions",
+    tags=["game-questions"],
+    default_response_class=ORJSONResponse,
+)
 
+VALID_GAME_TYPES: frozenset[str] = frozenset(GameQuestionAgent.SUPPORTED_GAME_TYPES)
+_INVALID_GAME_TYPE_DETAIL = {
+    "error": "INVALID_GAME_TYPE",
+    "detail": f"Valid types: {GameQuestionAgent.SUPPORTED_GAME_TYPES}",
+}
 
 
 @router.get("/{game_type}")
@@ -27,11 +36,10 @@ async def get_questions(
 
     Returns questions from the database. Use only_reviewed=true for production use.
     """
-    valid_types = GameQuestionAgent.SUPPORTED_GAME_TYPES
-    if game_type not in valid_types:
+    if game_type not in VALID_GAME_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"error": "INVALID_GAME_TYPE", "detail": f"Valid types: {valid_types}"},
+            detail=_INVALID_GAME_TYPE_DETAIL,
         )
 
     service = GameQuestionService(db)
@@ -1,15 +1,17 @@
 """LLM API endpoints."""
 
 from fastapi import APIRouter, Header, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 
-from app.llm.factory import LLMFactory, LLMServiceError
+from app.llm.factory import LLMFactory
 from app.schemas.llm import ModelsListResponse, ModelInfo
 
 router = APIRouter(prefix="/api/llm", tags=["llm"])
 
 class ModelsRequest(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True, cache_strings="all")
+
     provider: str
     api_key: str
 
@@ -25,15 +27,10 @@ async def list_available_models(request: ModelsRequest):
         )
         
     try:
-        models = LLMFactory.list_models(request.provider, request.api_key)
+        models = await LLMFactory.list_models(request.provider, request.api_key)
         return ModelsListResponse(
             models=[ModelInfo(**m) for m in models]
         )
-    except LLMServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e)
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2,13 +2,12 @@
 
 from fastapi import APIRouter, HTTPException
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import CurrentUser, NotificationServiceDep
 from app.schemas.notification import (
     NotificationListResponse,
     NotificationResponse,
     UnreadCountResponse,
 )
-from app.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
@@ -16,13 +15,13 @@ router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 @router.get("", response_model=NotificationListResponse)
 async def get_notifications(
     current_user: CurrentUser,
-    db: DbSession,
+    service: NotificationServiceDep,
     limit: int = 50,
 ) -> NotificationListResponse:
     """Get user's notifications."""
-    service = NotificationService(db)
-    notifications = await service.get_user_notifications(current_user.id, limit=limit)
-    unread_count = await service.get_unread_count(current_user.id)
+    notifications, unread_count = await service.get_notifications_with_unread_count(
+        current_user.id, limit=limit
+    )
 
     return NotificationListResponse(
         notifications=[
@@ -35,10 +34,9 @@ async def get_notifications(
 @router.get("/unread-count", response_model=UnreadCountResponse)
 async def get_unread_count(
     current_user: CurrentUser,
-    db: DbSession,
+    service: NotificationServiceDep,
 ) -> UnreadCountResponse:
     """Get count of unread notifications."""
-    service = NotificationService(db)
     count = await service.get_unread_count(current_user.id)
     return UnreadCountResponse(unreadCount=count)
 
@@ -47,10 +45,9 @@ async def get_unread_count(
 async def mark_as_read(
     notification_id: int,
     current_user: CurrentUser,
-    db: DbSession,
+    service: NotificationServiceDep,
 ) -> dict:
     """Mark a notification as read."""
-    service = NotificationService(db)
     success = await service.mark_as_read(notification_id, current_user.id)
 
     if not success:
@@ -62,10 +59,9 @@ async def mark_as_read(
 @router.post("/read-all")
 async def mark_all_as_read(
     current_user: CurrentUser,
-    db: DbSession,
+    service: NotificationServiceDep,
 ) -> dict:
     """Mark all notifications as read."""
-    service = NotificationService(db)
     count = await service.mark_all_as_read(current_user.id)
     return {"success": True, "count": count}
 
@@ -74,10 +70,9 @@ async def mark_all_as_read(
 async def delete_notification(
     notification_id: int,
     current_user: CurrentUser,
-    db: DbSession,
+    service: NotificationServiceDep,
 ) -> dict:
     """Delete a notification."""
-    service = NotificationService(db)
     success = await service.delete_notification(notification_id, current_user.id)
 
     if not success:
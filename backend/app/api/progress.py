@@ -1,8 +1,9 @@
 """Progress tracking API endpoints."""
 
 from fastapi import APIRouter
+from pydantic import TypeAdapter
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import AchievementServiceDep, CurrentUser, ProgressServiceDep
 from app.schemas.progress import (
     ActivityRequest,
     ActivityResponse,
@@ -14,19 +15,21 @@ from app.schemas.progress import (
     StreakData,
     StreakDay,
 )
-from app.services.progress_service import ProgressService
-from app.services.achievement_service import AchievementService
 
 router = APIRouter(prefix="/api/progress", tags=["progress"])
 
+# Lists are validated in one pass by a prebuilt validator rather than one
+# model construction per item
+_STREAK_DAYS_ADAPTER = TypeAdapter(list[StreakDay])
+_ACHIEVEMENTS_ADAPTER = TypeAdapter(list[AchievementResponse])
+
 
 @router.get("/stats", response_model=LearningStats)
 async def get_learning_stats(
     current_user: CurrentUser,
-    db: DbSession,
+    progress_service: ProgressServiceDep,
 ) -> LearningStats:
     """Get comprehensive learning statistics for the current user."""
-    progress_service = ProgressService(db)
     stats = await progress_service.get_learning_stats(current_user.id)
     return LearningStats(**stats)
 
@@ -34,14 +37,13 @@ async def get_learning_stats(
 @router.get("/streak", response_model=StreakData)
 async def get_streak_data(
     current_user: CurrentUser,
-    db: DbSession,
+    progress_service: ProgressServiceDep,
 ) -> StreakData:
     """Get streak data including 28-day history."""
-    progress_service = ProgressService(db)
     streak_data = await progress_service.get_streak_data(current_user.id)
     
     # Convert history dicts to StreakDay models
-    history = [StreakDay(**day) for day in streak_data["history"]]
+    history = _STREAK_DAYS_ADAPTER.validate_python(streak_data["history"])
     
     return StreakData(
         currentStreak=streak_data["currentStreak"],
@@ -56,14 +58,12 @@ async def get_streak_data(
 async def record_activity(
     request: ActivityRequest,
     current_user: CurrentUser,
-    db: DbSession,
+    progress_service: ProgressServiceDep,
+    achievement_service: AchievementServiceDep,
 ) -> ActivityResponse:
     """Record a learning activity and update progress."""
-    progress_service = ProgressService(db)
-    achievement_service = AchievementService(db)
-
-    # Record the activity
-    progress = await progress_service.record_activity(
+    # Record the activity; the updated streak comes back with it
+    progress, streak = await progress_service.record_activity(
         user_id=current_user.id,
         xp=request.xp,
         words_learned=request.wordsLearned,
@@ -74,9 +74,6 @@ async def record_activity(
     new_achievements = await achievement_service.check_and_unlock_achievements(current_user.id)
     achievement_names = [a.name for a in new_achievements]
 
-    # Get current streak
-    streak = await progress_service.get_or_create_streak(current_user.id)
-
     return ActivityResponse(
         success=True,
         xpEarned=progress.xp_earned,
@@ -88,21 +85,20 @@ async def record_activity(
 @router.get("/achievements", response_model=AchievementsListResponse)
 async def get_achievements(
     current_user: CurrentUser,
-    db: DbSession,
+    achievement_service: AchievementServiceDep,
 ) -> AchievementsListResponse:
     """Get all achievements with user unlock status."""
-    achievement_service = AchievementService(db)
     achievements = await achievement_service.get_user_achievements(current_user.id)
     
     return AchievementsListResponse(
-        achievements=[AchievementResponse(**a) for a in achievements]
+        achievements=_ACHIEVEMENTS_ADAPTER.validate_python(achievements)
     )
 
 
 @router.get("/history", response_model=ProgressHistoryResponse)
 async def get_progress_history(
     current_user: CurrentUser,
-    db: DbSession,
+    progress_service: ProgressServiceDep,
     days: int = 30,
 ) -> ProgressHistoryResponse:
     """Get progress history for learning curve visualization.
@@ -113,7 +109,6 @@ async def get_progress_history(
     # Limit days to prevent excessive data fetching
     days = min(max(days, 7), 90)
     
-    progress_service = ProgressService(db)
     history_data = await progress_service.get_progress_history(current_user.id, days)
     
     # Convert history dicts to ProgressHistoryDay models
@@ -1,10 +1,17 @@
 """Reading API endpoints."""
 
-import json
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status, Query, Header
 
-from app.api.deps import CurrentUser, DbSession
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Query, Header
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import CurrentUser, DbSession, ReadingServiceDep
+from app.database import async_session_maker
+from app.models.reading import ReadingArticle
 from app.schemas.reading import (
     ArticleCreateRequest,
     ArticleListSummaryResponse,
@@ -17,17 +24,51 @@ from app.schemas.reading import (
 )
 from app.services.reading_service import ReadingService
 from app.services.url_extractor import get_url_extractor
-from app.llm.factory import LLMContext, LLMFactory, LLMServiceError
+from app.llm.factory import LLMContext, LLMFactory, LLMServiceError, json_mode
 from app.llm.prompts import READING_ANALYSIS_PROMPT
+from app.utils.sse import SSE_DONE, sse_event
 
 router = APIRouter(prefix="/api/reading", tags=["reading"])
 
+# Body of a markdown code fence (```json ... ``` or ``` ... ```); an unclosed
+# fence runs to the end of the text
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# Only the start of long articles is sent for analysis
+ANALYSIS_CONTENT_LIMIT = 8000
+
+# The analysis prompt is rendered once around a placeholder, so building it
+# per request is a plain concatenation instead of a str.format() parse
+_ANALYSIS_PROMPT_HEAD, _ANALYSIS_PROMPT_TAIL = READING_ANALYSIS_PROMPT.format(content="\0").split("\0")
+
+
+def _analysis_prompt(content: str) -> str:
+    """Build the reading analysis prompt for an article's content."""
+    return _ANALYSIS_PROMPT_HEAD + content[:ANALYSIS_CONTENT_LIMIT] + _ANALYSIS_PROMPT_TAIL
+
+
+def _encode_cursor(article) -> str:
+    """Encode an article's sort key as an opaque page cursor."""
+    return f"{article.created_at.isoformat()},{article.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a page cursor back into a (created_at, id) sort key."""
+    try:
+        created_at, article_id = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(created_at), int(article_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "INVALID_CURSOR", "message": "Invalid pagination cursor"},
+        )
+
 
 @router.post("/articles", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
 async def create_article(
     request: ArticleCreateRequest,
     current_user: CurrentUser,
-    db: DbSession,
+    service: ReadingServiceDep,
 ) -> ArticleResponse:
     """
     Create a new reading article.
@@ -35,7 +76,6 @@ async def create_article(
     Import text content for reading practice. Words can be clicked
     to look up definitions and add to wordlist.
     """
-    service = ReadingService(db)
     article = await service.create_article(
         user_id=current_user.id,
         title=request.title,
@@ -48,24 +88,25 @@ async def create_article(
 @router.get("/articles", response_model=ArticleListSummaryResponse)
 async def list_articles(
     current_user: CurrentUser,
-    db: DbSession,
+    service: ReadingServiceDep,
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ) -> ArticleListSummaryResponse:
     """
-    Get user's reading articles.
+    Get user's reading articles, newest first.
 
     Returns article summaries (without full content) for efficiency.
+    Pages are chained with the returned next_cursor.
     """
-    service = ReadingService(db)
-    articles, total = await service.get_user_articles(
+    articles, has_more = await service.get_user_articles(
         user_id=current_user.id,
         limit=limit,
-        offset=offset,
+        after=_decode_cursor(cursor) if cursor else None,
     )
     return ArticleListSummaryResponse(
-        total=total,
         articles=[ArticleSummary.model_validate(a) for a in articles],
+        has_more=has_more,
+        next_cursor=_encode_cursor(articles[-1]) if has_more else None,
     )
 
 
@@ -73,10 +114,9 @@ async def list_articles(
 async def get_article(
     article_id: int,
     current_user: CurrentUser,
-    db: DbSession,
+    service: ReadingServiceDep,
 ) -> ArticleResponse:
     """Get a specific article by ID with full content."""
-    service = ReadingService(db)
     article = await service.get_article(article_id, current_user.id)
 
     if not article:
@@ -93,10 +133,9 @@ async def update_article(
     article_id: int,
     request: ArticleUpdateRequest,
     current_user: CurrentUser,
-    db: DbSession,
+    service: ReadingServiceDep,
 ) -> ArticleResponse:
     """Update an article's title or content."""
-    service = ReadingService(db)
     article = await service.update_article(
         article_id=article_id,
         user_id=current_user.id,
@@ -117,10 +156,9 @@ async def update_article(
 async def delete_article(
     article_id: int,
     current_user: CurrentUser,
-    db: DbSession,
+    service: ReadingServiceDep,
 ) -> None:
     """Delete an article."""
-    service = ReadingService(db)
     deleted = await service.delete_article(article_id, current_user.id)
 
     if not deleted:
@@ -156,11 +194,82 @@ async def import_from_url(
         )
 
 
+async def _persist_analysis(article_id: int, user_id: int, analysis_json: str) -> None:
+    """Store a generated analysis on the article row (runs after the response)."""
+    # The request's session is closed by now, so use a fresh one
+    async with async_session_maker() as session:
+        await ReadingService(session).save_analysis(article_id, user_id, analysis_json)
+
+
+async def _get_article_for_analysis(
+    service: ReadingService, article_id: int, user_id: int
+) -> tuple[Optional[ReadingArticle], Optional[dict]]:
+    """
+    Look up an existing analysis, or the article to analyze.
+
+    Returns (None, analysis) for a shared-cache hit, (article, analysis) when
+    the article row holds one, and (article, None) when it must be generated.
+    """
+    # Shared cache first: a hit needs no DB access at all
+    cached_data = await service.get_cached_analysis(article_id, user_id)
+    if cached_data is not None:
+        return None, cached_data
+
+    article = await service.get_article(article_id, user_id)
+    if not article:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "ARTICLE_NOT_FOUND", "message": "Article not found"},
+        )
+
+    # Check if we have cached analysis
+    if article.ai_analysis_json:
+        try:
+            cached_data = orjson.loads(article.ai_analysis_json)
+            ReadingAnalysisResponse(**{**cached_data, "cached": True})
+            await service.cache_analysis(article_id, user_id, cached_data)
+            return article, cached_data
+        except ValueError:  # includes orjson.JSONDecodeError and ValidationError
+            pass  # Invalid cache, regenerate
+
+    return article, None
+
+
+@asynccontextmanager
+async def _analysis_llm(
+    db: DbSession,
+    provider: Optional[str],
+    api_key: Optional[str],
+    model: Optional[str],
+):
+    """Yield the LLM for an analysis: the client's key if given (BYOK), else the active config."""
+    if api_key:
+        # Use client-provided API key
+        yield LLMFactory.create(provider=provider, api_key=api_key, model=model)
+    else:
+        # Fall back to LLMContext (admin settings -> env variables)
+        async with LLMContext(db, endpoint="reading_analysis") as ctx:
+            yield ctx.llm
+
+
+def _parse_analysis(analysis_text: str) -> dict:
+    """Parse the LLM's analysis JSON."""
+    # JSON mode should return a bare object; still handle markdown code
+    # blocks from models that ignore it
+    fence = _FENCE_RE.search(analysis_text)
+    if fence:
+        analysis_text = fence.group(1)
+
+    return orjson.loads(analysis_text.strip())
+
+
 @router.post("/articles/{article_id}/analyze", response_model=ReadingAnalysisResponse)
 async def analyze_article(
     article_id: int,
     current_user: CurrentUser,
     db: DbSession,
+    service: ReadingServiceDep,
+    background_tasks: BackgroundTasks,
     provider: Optional[str] = Header(None, alias="X-Bondify-AI-Provider"),
     api_key: Optional[str] = Header(None, alias="X-Bondify-AI-Key"),
     model: Optional[str] = Header(None, alias="X-Bondify-AI-Model"),
@@ -169,67 +278,43 @@ async def analyze_article(
     Analyze article content using AI.
     
     Returns suggested vocabulary, summary, key concepts, and grammar highlights.
-    Results are cached to avoid repeated API calls.
+    Results are cached to avoid repeated API calls; a new analysis is
+    written to the article after the response has been sent.
     
     Supports BYOK (Bring Your Own Key) via X-Bondify-AI-* headers.
     Priority: Client API Key -> Admin Settings -> Environment Variables
     """
-    service = ReadingService(db)
-    article = await service.get_article(article_id, current_user.id)
-    
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": "ARTICLE_NOT_FOUND", "message": "Article not found"},
-        )
-    
-    # Check if we have cached analysis
-    if article.ai_analysis_json:
-        try:
-            cached_data = json.loads(article.ai_analysis_json)
-            cached_data["cached"] = True
-            return ReadingAnalysisResponse(**cached_data)
-        except (json.JSONDecodeError, ValueError):
-            pass  # Invalid cache, regenerate
+    article, cached_data = await _get_article_for_analysis(service, article_id, current_user.id)
+    if cached_data is not None:
+        return ReadingAnalysisResponse(**{**cached_data, "cached": True})
     
     # Generate new analysis using LLM
     try:
-        prompt = READING_ANALYSIS_PROMPT.format(content=article.content[:8000])  # Limit content length
+        prompt = _analysis_prompt(article.content)
         
-        # Check if user provides custom API key (BYOK)
-        if api_key:
-            # Use client-provided API key
-            llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
-            response = await llm.ainvoke(prompt)
-        else:
-            # Fall back to LLMContext (admin settings -> env variables)
-            async with LLMContext(db, endpoint="reading_analysis") as ctx:
-                response = await ctx.llm.ainvoke(prompt)
+        async with _analysis_llm(db, provider, api_key, model) as llm:
+            response = await json_mode(llm).ainvoke(prompt)
         
         analysis_text = response.content if hasattr(response, 'content') else str(response)
+        analysis_data = _parse_analysis(analysis_text)
         
-        # Parse JSON from response
-        # Handle potential markdown code blocks
-        if "```json" in analysis_text:
-            analysis_text = analysis_text.split("```json")[1].split("```")[0]
-        elif "```" in analysis_text:
-            analysis_text = analysis_text.split("```")[1].split("```")[0]
-        
-        analysis_data = json.loads(analysis_text.strip())
-        
-        # Cache the analysis
-        article.ai_analysis_json = json.dumps(analysis_data)
-        await db.commit()
+        response = ReadingAnalysisResponse(**{**analysis_data, "cached": False})
+
+        # Cache the analysis; the shared cache serves repeats while the
+        # DB write happens after the response has been sent
+        await service.cache_analysis(article_id, current_user.id, analysis_data)
+        background_tasks.add_task(
+            _persist_analysis, article_id, current_user.id, orjson.dumps(analysis_data).decode()
+        )
         
-        analysis_data["cached"] = False
-        return ReadingAnalysisResponse(**analysis_data)
+        return response
         
     except LLMServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"error": "LLM_SERVICE_ERROR", "message": str(e.message)},
         )
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "ANALYSIS_PARSE_ERROR", "message": f"Failed to parse AI response: {str(e)}"},
@@ -239,3 +324,66 @@ async def analyze_article(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "ANALYSIS_ERROR", "message": f"Failed to analyze article: {str(e)}"},
         )
+
+
+@router.post("/articles/{article_id}/analyze/stream")
+async def analyze_article_stream(
+    article_id: int,
+    current_user: CurrentUser,
+    db: DbSession,
+    service: ReadingServiceDep,
+    provider: Optional[str] = Header(None, alias="X-Bondify-AI-Provider"),
+    api_key: Optional[str] = Header(None, alias="X-Bondify-AI-Key"),
+    model: Optional[str] = Header(None, alias="X-Bondify-AI-Model"),
+):
+    """
+    Analyze article content using AI, streamed as Server-Sent Events.
+
+    Each event carries a JSON object: {"type": "delta", "delta": ...} chunks
+    of the raw analysis JSON while it is generated, then a final
+    {"type": "done", ...} with the parsed analysis (same fields as the
+    non-streaming endpoint), then [DONE]. A cached analysis is sent as the
+    "done" event straight away. On failure an {"error": ..., "message": ...}
+    event is sent instead.
+    """
+    article, cached_data = await _get_article_for_analysis(service, article_id, current_user.id)
+
+    async def generate_stream():
+        if cached_data is not None:
+            yield sse_event({"type": "done", **cached_data, "cached": True})
+            yield SSE_DONE
+            return
+
+        try:
+            prompt = _analysis_prompt(article.content)
+            parts = []
+            async with _analysis_llm(db, provider, api_key, model) as llm:
+                async for chunk in json_mode(llm).astream(prompt):
+                    if chunk.content:
+                        parts.append(chunk.content)
+                        yield sse_event({"type": "delta", "delta": chunk.content})
+
+            analysis_data = _parse_analysis("".join(parts))
+            ReadingAnalysisResponse(**{**analysis_data, "cached": False})
+            await service.cache_analysis(article_id, current_user.id, analysis_data)
+            await _persist_analysis(article_id, current_user.id, orjson.dumps(analysis_data).decode())
+
+            yield sse_event({"type": "done", **analysis_data, "cached": False})
+            yield SSE_DONE
+
+        except LLMServiceError as e:
+            yield sse_event({"error": "LLM_SERVICE_ERROR", "message": str(e.message)})
+        except orjson.JSONDecodeError as e:
+            yield sse_event({"error": "ANALYSIS_PARSE_ERROR", "message": f"Failed to parse AI response: {str(e)}"})
+        except Exception as e:
+            yield sse_event({"error": "ANALYSIS_ERROR", "message": f"Failed to analyze article: {str(e)}"})
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -2,9 +2,8 @@
 
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_srs_service
 from app.models.user import User
 from app.services.srs_service import SpacedRepetitionService
 
@@ -71,7 +70,7 @@ class ForecastResponse(BaseModel):
 @router.get("/due", response_model=DueWordsResponse)
 async def get_due_words(
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    service: SpacedRepetitionService = Depends(get_srs_service),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -80,7 +79,6 @@ async def get_due_words(
     Returns words that are due for review now, plus new words
     that haven't started the SRS process yet.
     """
-    service = SpacedRepetitionService(db)
     words = await service.get_due_words(current_user.id, limit)
     return DueWordsResponse(words=words, total=len(words))
 
@@ -88,7 +86,7 @@ async def get_due_words(
 @router.post("/review", response_model=ReviewResponse)
 async def record_review(
     request: ReviewRequest,
-    db: AsyncSession = Depends(get_db),
+    service: SpacedRepetitionService = Depends(get_srs_service),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -100,7 +98,6 @@ async def record_review(
     - 3 (Good): Remembered after a hesitation
     - 4 (Easy): Remembered instantly
     """
-    service = SpacedRepetitionService(db)
     try:
         result = await service.record_review(
             current_user.id,
@@ -114,11 +111,10 @@ async def record_review(
 
 @router.get("/stats", response_model=SRSStats)
 async def get_srs_stats(
-    db: AsyncSession = Depends(get_db),
+    service: SpacedRepetitionService = Depends(get_srs_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get SRS statistics for the current user."""
-    service = SpacedRepetitionService(db)
     stats = await service.get_srs_stats(current_user.id)
     return SRSStats(**stats)
 
@@ -126,7 +122,7 @@ async def get_srs_stats(
 @router.get("/forecast", response_model=ForecastResponse)
 async def get_review_forecast(
     days: int = 7,
-    db: AsyncSession = Depends(get_db),
+    service: SpacedRepetitionService = Depends(get_srs_service),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -134,6 +130,5 @@ async def get_review_forecast(
 
     Shows how many cards will be due for review each day.
     """
-    service = SpacedRepetitionService(db)
     forecast = await service.get_review_forecast(current_user.id, days)
     return ForecastResponse(forecast=forecast)
@@ -9,12 +9,14 @@ from fastapi.responses import Response
 from pydantic import BaseModel
 import logging
 
-from app.services.tts_service import get_tts_service
+from app.services.tts_service import get_tts_service, phonemize_cached, synthesize_async
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tts", tags=["TTS"])
 
+_content_disposition = 'inline; filename="{}.wav"'.format
+
 
 class SpeakRequest(BaseModel):
     """Request body for TTS synthesis."""
@@ -63,7 +65,7 @@ async def synthesize_speech(request: SpeakRequest):
             detail="TTS service unavailable. Please ensure Piper model is installed."
         )
     
-    audio_data = tts.synthesize(text=request.text)
+    audio_data = await synthesize_async(request.text)
     
     if audio_data is None:
         raise HTTPException(
@@ -72,17 +74,12 @@ async def synthesize_speech(request: SpeakRequest):
         )
     
     # Use text for filename, remove non-ASCII characters
-    filename_base = request.text[:20]
-    filename_safe = ''.join(c for c in filename_base if ord(c) < 128)
-    if not filename_safe:
-        filename_safe = "audio"
+    filename_safe = request.text[:20].encode("ascii", "ignore").decode("ascii") or "audio"
     
     return Response(
         content=audio_data,
         media_type="audio/wav",
-        headers={
-            "Content-Disposition": f'inline; filename="{filename_safe}.wav"'
-        }
+        headers={"Content-Disposition": _content_disposition(filename_safe)},
     )
 
 
@@ -126,7 +123,7 @@ async def phonemize_text(request: PhonemizeRequest) -> PhonemizeResponse:
             detail="TTS service unavailable"
         )
     
-    phonemes = tts.phonemize(request.text)
+    phonemes = await phonemize_cached(request.text)
     
     return PhonemizeResponse(
         text=request.text,
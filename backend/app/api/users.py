@@ -1,8 +1,10 @@
 """User API endpoints."""
 
 from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import update
 
 from app.api.deps import CurrentUser, DbSession
+from app.models.user import User
 from app.schemas.error import ErrorResponse
 from app.schemas.user import UserProfileResponse, UserResponse, UserUpdate
 
@@ -38,11 +40,19 @@ async def update_current_user_profile(
     """Update the current user's profile."""
     # Update only provided fields
     update_dict = update_data.model_dump(exclude_unset=True)
-    
-    for field, value in update_dict.items():
-        setattr(current_user, field, value)
-    
-    await db.flush()
-    await db.refresh(current_user)
-    
-    return UserProfileResponse.from_user(current_user)
+    if not update_dict:
+        return UserProfileResponse.from_user(current_user)
+
+    # One UPDATE ... RETURNING writes the row and refreshes current_user
+    # (populate_existing) instead of a flush followed by a re-select
+    stmt = (
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**update_dict)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    user = result.scalar_one()
+
+    return UserProfileResponse.from_user(user)
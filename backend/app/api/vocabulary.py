@@ -1,45 +1,57 @@
 """Vocabulary API endpoints."""
 
+import asyncio
+import time
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.vocabulary_service import VocabularyService
+from app.services.vocabulary_service import (
+    VocabularyService,
+    await_inflight_lookup,
+    cached_definition_etag,
+    inflight_lookup,
+)
 from app.schemas.vocabulary import (
     VocabularyLookupRequest,
     VocabularyLookupResponse,
 )
-from app.database import get_db
-from app.llm.factory import LLMFactory, LLMServiceError
+from app.database import async_session_maker, get_db
+from app.llm.factory import LLMFactory, LLMServiceError, get_active_llm_config
+from app.llm.vocabulary_agent import VocabularyAgent
+from app.utils.responses import ORJSONResponse
+from app.utils.sse import SSE_DONE, sse_event
 
 router = APIRouter(prefix="/api/vocabulary", tags=["vocabulary"])
 
+# Streamed token events are coalesced into one write once this many bytes are
+# pending or this many seconds have passed since the last write.
+SSE_FLUSH_BYTES = 4096
+SSE_FLUSH_INTERVAL = 0.05
 
-@router.post("/lookup", response_model=VocabularyLookupResponse)
-async def lookup_word(
-    request: VocabularyLookupRequest,
-    db: AsyncSession = Depends(get_db),
-    provider: Optional[str] = Header(None, alias="X-Bondify-AI-Provider"),
-    api_key: Optional[str] = Header(None, alias="X-Bondify-AI-Key"),
-    model: Optional[str] = Header(None, alias="X-Bondify-AI-Model"),
-):
-    """
-    Look up comprehensive information about a word.
+# Raw newlines would end the SSE "data:" line early, so they are escaped
+_NL_TABLE = str.maketrans({"\n": "\\n", "\r": "\\r"})
 
-    Returns detailed word information including:
-    - Definition, part of speech, pronunciation
-    - Word structure (prefix, root, suffix) and etymology
-    - Multiple meanings with contexts and examples
-    - Collocations and synonyms
-    - Learning tips, visual tricks, memory phrases
-    - Common mistakes to avoid
 
-    Response includes 'source' field: "cache" (from DB) or "ai" (fresh lookup).
-    
-    Supports BYOK (Bring Your Own Key) via X-Bondify-AI-* headers.
-    """
+def _etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Whether an If-None-Match header names the given ETag (weak comparison)."""
+    if not if_none_match or not etag:
+        return False
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag == etag for tag in candidates)
+
+
+async def _lookup_word(
+    word: str,
+    db: AsyncSession,
+    provider: Optional[str],
+    api_key: Optional[str],
+    model: Optional[str],
+):
+    """Look a word up for /lookup, sending cache hits with their ETag."""
     try:
         service = VocabularyService(db)
         
@@ -48,10 +60,15 @@ async def lookup_word(
         if api_key:
             custom_llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
         
-        result, source = await service.lookup_word(request.word, custom_llm=custom_llm)
+        result, source = await service.lookup_word(word, custom_llm=custom_llm)
 
         # Add source info to response
         response_data = {**result, "source": source}
+        if source == "cache":
+            etag = cached_definition_etag(word.strip().lower())
+            headers = {"ETag": etag} if etag else None
+            # Stored definitions were normalized before caching; send as-is
+            return ORJSONResponse(response_data, headers=headers)
         return VocabularyLookupResponse(**response_data)
 
     except ValueError as e:
@@ -83,6 +100,57 @@ async def lookup_word(
         )
 
 
+@router.post("/lookup", response_model=VocabularyLookupResponse)
+async def lookup_word(
+    request: VocabularyLookupRequest,
+    db: AsyncSession = Depends(get_db),
+    provider: Optional[str] = Header(None, alias="X-Bondify-AI-Provider"),
+    api_key: Optional[str] = Header(None, alias="X-Bondify-AI-Key"),
+    model: Optional[str] = Header(None, alias="X-Bondify-AI-Model"),
+):
+    """
+    Look up comprehensive information about a word.
+
+    Returns detailed word information including:
+    - Definition, part of speech, pronunciation
+    - Word structure (prefix, root, suffix) and etymology
+    - Multiple meanings with contexts and examples
+    - Collocations and synonyms
+    - Learning tips, visual tricks, memory phrases
+    - Common mistakes to avoid
+
+    Response includes 'source' field: "cache" (from DB) or "ai" (fresh lookup).
+    Cached responses carry an ETag, which GET /lookup/{word} revalidates.
+    
+    Supports BYOK (Bring Your Own Key) via X-Bondify-AI-* headers.
+    """
+    return await _lookup_word(request.word, db, provider, api_key, model)
+
+
+@router.get("/lookup/{word}", response_model=VocabularyLookupResponse)
+async def get_word(
+    word: str,
+    db: AsyncSession = Depends(get_db),
+    provider: Optional[str] = Header(None, alias="X-Bondify-AI-Provider"),
+    api_key: Optional[str] = Header(None, alias="X-Bondify-AI-Key"),
+    model: Optional[str] = Header(None, alias="X-Bondify-AI-Model"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Look up a word like POST /lookup, with conditional request support.
+
+    Sending a cached response's ETag back in If-None-Match gets an empty 304
+    while the stored definition is unchanged.
+    """
+    normalized_word = word.strip().lower()
+    # A definition already held in memory is revalidated without a lookup
+    etag = cached_definition_etag(normalized_word)
+    if _etag_matches(if_none_match, etag):
+        VocabularyService(db).record_lookup(normalized_word)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return await _lookup_word(word, db, provider, api_key, model)
+
+
 @router.post("/lookup/stream")
 async def lookup_word_stream(
     request: VocabularyLookupRequest,
@@ -99,70 +167,101 @@ async def lookup_word_stream(
     
     Supports BYOK (Bring Your Own Key) via X-Bondify-AI-* headers.
     """
-    from app.llm.vocabulary_agent import VocabularyAgent
-    from app.llm.factory import get_active_llm_config
-    
+    async def load_llm_config():
+        if api_key:
+            return None
+        # Own session, so it can run alongside the cache check on `db`; the
+        # config is usually an in-memory hit and then no connection is used
+        async with async_session_maker() as config_db:
+            return await get_active_llm_config(config_db)
+
     async def generate_stream():
         try:
-            # Check cache first
+            # Check cache first, resolving the provider config alongside it
             service = VocabularyService(db)
-            cached = await service._get_cached(request.word.strip().lower())
+            normalized_word = request.word.strip().lower()
+            cached, config = await asyncio.gather(
+                service.get_definition(normalized_word),
+                load_llm_config(),
+                return_exceptions=True,
+            )
+            if isinstance(cached, BaseException):
+                raise cached
             
-            if cached:
+            if cached is not None:
                 # If cached, send complete data immediately
-                cached.lookup_count += 1
-                await db.commit()
-                yield f"data: {cached.definition_json}\n\n"
-                yield "data: [DONE]\n\n"
+                service.record_lookup(normalized_word)
+                yield sse_event(cached) + SSE_DONE
+                return
+            
+            # Another request is already generating this word; send its result
+            shared = await await_inflight_lookup(normalized_word)
+            if shared is not None:
+                yield sse_event(shared) + SSE_DONE
                 return
             
-            # Create LLM instance
-            if api_key:
-                llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
-            else:
-                # Use DB-configured provider
-                config = await get_active_llm_config(db)
-                llm = LLMFactory.create(
-                    provider=config.get("provider_type"),
-                    api_key=config.get("api_key"),
-                    model=config.get("model")
-                )
+            with inflight_lookup(normalized_word) as lookup:
+                # Create LLM instance
+                if api_key:
+                    llm = LLMFactory.create(provider=provider, api_key=api_key, model=model)
+                else:
+                    # Use DB-configured provider (a config error only matters on a miss)
+                    if isinstance(config, BaseException):
+                        raise config
+                    llm = LLMFactory.create(
+                        provider=config.get("provider_type"),
+                        api_key=config.get("api_key"),
+                        model=config.get("model")
+                    )
             
-            agent = VocabularyAgent(llm=llm)
+                agent = VocabularyAgent(llm=llm)
             
-            # Accumulate content for caching
-            full_content = ""
+                # Raw response bytes, parsed once for caching when the stream ends
+                raw = bytearray()
+                buf = bytearray()
+                last_flush = time.monotonic()
             
-            async for chunk in agent.lookup_word_stream(request.word):
-                full_content += chunk
-                # Send SSE event with chunk - escape newlines to keep content on single line
-                # Newlines in SSE data break the format since each line needs "data:" prefix
-                escaped_chunk = chunk.replace('\n', '\\n')
-                yield f"data: {escaped_chunk}\n\n"
+                async for chunk in agent.lookup_word_stream(request.word):
+                    raw += chunk.encode()
+                    buf += b"data: "
+                    buf += chunk.translate(_NL_TABLE).encode()
+                    buf += b"\n\n"
+                    now = time.monotonic()
+                    if len(buf) >= SSE_FLUSH_BYTES or now - last_flush >= SSE_FLUSH_INTERVAL:
+                        yield bytes(buf)
+                        buf.clear()
+                        last_flush = now
             
-            yield "data: [DONE]\n\n"
+                buf += SSE_DONE
+                yield bytes(buf)
             
-            # Try to cache the complete response
-            try:
-                # Parse the accumulated content
-                parsed = agent._parse_json_response(full_content)
-                validated = agent._validate_word_definition(parsed)
-                validated["word"] = request.word.strip().lower()
-                await service._save_to_cache(request.word.strip().lower(), validated)
-            except Exception:
-                # Caching failed, but streaming was successful
-                pass
+                # Try to cache the complete response
+                try:
+                    try:
+                        parsed = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # Fenced or wrapped output goes through the tolerant parser
+                        parsed = agent._parse_json_response(raw.decode())
+                    validated = agent._validate_word_definition(parsed)
+                    validated["word"] = normalized_word
+                    await service._save_to_cache(normalized_word, validated)
+                    # Shared only once the row is committed; if caching failed
+                    # the lookup is cancelled and waiters look the word up themselves
+                    lookup.set_result(validated)
+                except Exception:
+                    # Caching failed, but streaming was successful
+                    pass
                 
         except ValueError as e:
-            yield f"data: {{\"error\": \"VALIDATION_ERROR\", \"detail\": \"{str(e)}\"}}\n\n"
+            yield sse_event({"error": "VALIDATION_ERROR", "detail": str(e)})
         except LLMServiceError as e:
-            yield f"data: {{\"error\": \"LLM_SERVICE_ERROR\", \"detail\": \"{str(e.message)}\"}}\n\n"
+            yield sse_event({"error": "LLM_SERVICE_ERROR", "detail": str(e.message)})
         except Exception as e:
-            yield f"data: {{\"error\": \"INTERNAL_ERROR\", \"detail\": \"An unexpected error occurred\"}}\n\n"
+            yield sse_event({"error": "INTERNAL_ERROR", "detail": "An unexpected error occurred"})
     
     return StreamingResponse(
         generate_stream(),
-        media_type="text/event-stream",
+        media_type="text/event-stream; charset=utf-8",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
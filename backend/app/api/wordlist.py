@@ -30,9 +30,10 @@ async def get_wordlist(
     service = WordlistService(db)
     words = await service.get_user_wordlist(current_user.id)
 
-    return WordlistResponse(
+    # Entries are built from typed DB columns, so skip per-item validation
+    return WordlistResponse.model_construct(
         total=len(words),
-        words=[WordlistEntryResponse(**w) for w in words],
+        words=[WordlistEntryResponse.model_construct(**w) for w in words],
     )
 
 
@@ -4,13 +4,16 @@ Provides command-line interface for managing the Bondify application.
 """
 
 import os
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 import typer
-import uvicorn
 from typing_extensions import Annotated
 
+# uvicorn and alembic are heavy imports only some commands need, so they are
+# imported on first use rather than on every CLI start (e.g. --version)
+_alembic = None
+
 app = typer.Typer(
     name="bondify",
     help="Bondify - English Learning Application with AI",
@@ -36,23 +39,87 @@ def main(
     pass
 
 
+def _get_alembic():
+    """Import alembic's Config class and command module once, on first use."""
+    global _alembic
+    if _alembic is None:
+        from alembic.config import Config
+        from alembic import command
+        _alembic = (Config, command)
+    return _alembic
+
+
+@lru_cache(maxsize=None)
+def _resolve_alembic_paths() -> Optional[tuple[str, str]]:
+    """Find (alembic.ini, script_location), or None if alembic is not bundled."""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    backend_dir = os.path.dirname(app_dir)
+    candidates = (
+        # Dev mode: backend/alembic.ini + backend/alembic/
+        (os.path.join(backend_dir, "alembic.ini"), os.path.join(backend_dir, "alembic")),
+        # pip-installed: app/alembic.ini + app/migrations/
+        (os.path.join(app_dir, "alembic.ini"), os.path.join(app_dir, "migrations")),
+    )
+    for alembic_ini, script_location in candidates:
+        if os.path.isfile(alembic_ini):
+            return alembic_ini, script_location
+    return None
+
+
+def _alembic_config(alembic_paths: tuple[str, str]):
+    """Build an alembic Config for the resolved paths."""
+    Config, _ = _get_alembic()
+    
+    alembic_ini, script_location = alembic_paths
+    alembic_cfg = Config(alembic_ini)
+    alembic_cfg.set_main_option("script_location", script_location)
+    return alembic_cfg
+
+
+def _require_alembic_paths() -> tuple[str, str]:
+    """Resolved alembic paths, exiting with an error if there are none."""
+    alembic_paths = _resolve_alembic_paths()
+    if alembic_paths is None:
+        typer.echo("❌ Error: alembic.ini not found", err=True)
+        raise typer.Exit(1)
+    return alembic_paths
+
+
+def _database_at_head(alembic_cfg) -> bool:
+    """Whether the database is already at the migration scripts' head revision(s).
+
+    Reading alembic_version is much cheaper than a no-op upgrade, which loads
+    env.py and the whole app model graph.
+    """
+    import asyncio
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from app.config import settings
+
+    async def current_heads() -> set[str]:
+        engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+        try:
+            async with engine.connect() as conn:
+                return await conn.run_sync(
+                    lambda sync_conn: set(MigrationContext.configure(sync_conn).get_current_heads())
+                )
+        finally:
+            await engine.dispose()
+
+    try:
+        heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+        return asyncio.run(current_heads()) == heads
+    except Exception:
+        # Unknown state: let the upgrade decide
+        return False
+
+
 def _run_migrations():
     """Run database migrations to head, or initialize DB if alembic not available."""
-    from alembic.config import Config
-    from alembic import command
-    
-    # Try dev mode path first: backend/alembic.ini + backend/alembic/
-    backend_dir = Path(__file__).parent.parent
-    alembic_ini = backend_dir / "alembic.ini"
-    script_location = backend_dir / "alembic"
-    
-    # Try pip-installed path: app/alembic.ini + app/migrations/
-    if not alembic_ini.exists():
-        app_dir = Path(__file__).parent
-        alembic_ini = app_dir / "alembic.ini"
-        script_location = app_dir / "migrations"
-    
-    if not alembic_ini.exists():
+    alembic_paths = _resolve_alembic_paths()
+    if alembic_paths is None:
         # No alembic at all - fallback to init_db
         typer.echo("   Using init_db (alembic not available)")
         try:
@@ -64,8 +131,11 @@ def _run_migrations():
             typer.echo(f"❌ Database init failed: {e}", err=True)
             return False
     
-    alembic_cfg = Config(str(alembic_ini))
-    alembic_cfg.set_main_option("script_location", str(script_location))
+    alembic_cfg = _alembic_config(alembic_paths)
+    if _database_at_head(alembic_cfg):
+        typer.echo("   Database already at the latest revision")
+        return True
+    _, command = _get_alembic()
     
     try:
         command.upgrade(alembic_cfg, "head")
@@ -92,6 +162,7 @@ def serve(
     
     typer.echo(f"🚀 Starting Bondify server on http://{host}:{port}")
     
+    import uvicorn
     uvicorn.run(
         "app.main:app",
         host=host,
@@ -118,6 +189,7 @@ def dev(
     typer.echo(f"🔧 Starting Bondify in dev mode on http://{host}:{port}")
     typer.echo("   Hot reload enabled" if reload else "   Hot reload disabled")
     
+    import uvicorn
     uvicorn.run(
         "app.main:app",
         host=host,
@@ -131,22 +203,11 @@ def migrate(
     revision: Annotated[str, typer.Argument(help="Target revision")] = "head",
 ):
     """Run database migrations to upgrade the schema."""
-    from alembic.config import Config
-    from alembic import command
+    _, command = _get_alembic()
     
     typer.echo(f"📦 Running database migrations to '{revision}'...")
     
-    # Find alembic.ini relative to this file
-    backend_dir = Path(__file__).parent.parent
-    alembic_ini = backend_dir / "alembic.ini"
-    
-    if not alembic_ini.exists():
-        typer.echo(f"❌ Error: alembic.ini not found at {alembic_ini}", err=True)
-        raise typer.Exit(1)
-    
-    alembic_cfg = Config(str(alembic_ini))
-    # Set script location relative to alembic.ini
-    alembic_cfg.set_main_option("script_location", str(backend_dir / "alembic"))
+    alembic_cfg = _alembic_config(_require_alembic_paths())
     
     command.upgrade(alembic_cfg, revision)
     typer.echo("✅ Migrations completed successfully!")
@@ -157,20 +218,11 @@ def migrate_down(
     revision: Annotated[str, typer.Argument(help="Target revision")] = "-1",
 ):
     """Rollback database migrations."""
-    from alembic.config import Config
-    from alembic import command
+    _, command = _get_alembic()
     
     typer.echo(f"⏪ Rolling back migrations to '{revision}'...")
     
-    backend_dir = Path(__file__).parent.parent
-    alembic_ini = backend_dir / "alembic.ini"
-    
-    if not alembic_ini.exists():
-        typer.echo(f"❌ Error: alembic.ini not found at {alembic_ini}", err=True)
-        raise typer.Exit(1)
-    
-    alembic_cfg = Config(str(alembic_ini))
-    alembic_cfg.set_main_option("script_location", str(backend_dir / "alembic"))
+    alembic_cfg = _alembic_config(_require_alembic_paths())
     
     command.downgrade(alembic_cfg, revision)
     typer.echo("✅ Rollback completed successfully!")
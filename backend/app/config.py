@@ -1,14 +1,21 @@
 """Application configuration settings."""
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    # Frozen: settings are read-only after load, and derived values can be cached
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+    )
+
     # Application
     APP_NAME: str = "English Learning API"
     DEBUG: bool = False
@@ -16,6 +23,22 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./app.db"
+    # Connection pool (server databases only; SQLite keeps the default pool).
+    # Keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the server's
+    # max_connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    # Seconds a request waits for a free connection before failing with 503
+    DB_POOL_TIMEOUT: int = 5
+    # Connections opened at startup so the first requests skip the handshake
+    DB_POOL_MIN_SIZE: int = 5
+    # Let an external pooler (e.g. PgBouncer in transaction mode) own pooling
+    DB_NULL_POOL: bool = False
+
+    # Redis (optional; shared session/cache store across workers)
+    REDIS_URL: str = ""
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
@@ -24,6 +47,10 @@ class Settings(BaseSettings):
     LLM_PROVIDER: str = "gemini"
     GOOGLE_API_KEY: str = ""
     MISTRAL_API_KEY: str = ""
+    MISTRAL_BASE_URL: str = "https://api.mistral.ai/v1"
+    # Seconds to reuse identical conversation replies/openings (0 disables;
+    # off by default since reused answers make conversations repeat)
+    LLM_RESPONSE_CACHE_TTL: int = 0
 
     # JWT
     JWT_ALGORITHM: str = "HS256"
@@ -33,15 +60,10 @@ class Settings(BaseSettings):
     # Seeding (set to true for demo environments like Render free tier)
     RUN_SEED_ON_STARTUP: bool = False
 
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse CORS origins from comma-separated string (once)."""
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
 
 
 @lru_cache
@@ -1,18 +1,96 @@
 """Database connection and session management."""
 
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Redis is optional - only used when REDIS_URL is configured
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+
+_IS_SQLITE = make_url(settings.DATABASE_URL).get_backend_name() == "sqlite"
+
+
+def _pool_options() -> dict[str, Any]:
+    """Connection pool settings for the configured database."""
+    if _IS_SQLITE:
+        # SQLAlchemy picks a pool suited to file or in-memory SQLite
+        return {}
+    if settings.DB_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Reuse the most recent connection so idle ones can be recycled
+        "pool_use_lifo": True,
+    }
+
+
+# Applied to every SQLite connection: WAL lets reads proceed during a write, and
+# under WAL synchronous=NORMAL stays crash-safe while skipping most fsyncs
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+)
+# Seconds a SQLite connection waits on a locked database before erroring
+SQLITE_BUSY_TIMEOUT = 30
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Engine "connect" listener applying SQLITE_PRAGMAS."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _connect_args() -> dict[str, Any]:
+    """DBAPI connect() arguments for the configured database."""
+    if _IS_SQLITE:
+        return {"timeout": SQLITE_BUSY_TIMEOUT}
+    return {}
+
 
-# Create async engine
+# Compiled SQL is cached per statement shape; sized above the default (500)
+# so the app's distinct queries all stay cached
+QUERY_CACHE_SIZE = 1200
+
+# Create async engine (one per process, shared by every session)
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    query_cache_size=QUERY_CACHE_SIZE,
+    # JSON columns are (de)serialized with orjson rather than the stdlib
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args(),
+    **_pool_options(),
 )
 
+if _IS_SQLITE:
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -27,6 +105,33 @@ class Base(DeclarativeBase):
     pass
 
 
+_redis_client: Optional[Any] = None
+
+
+def get_redis() -> Optional[Any]:
+    """Get the shared async Redis client, or None if Redis is not configured."""
+    global _redis_client
+    if not settings.REDIS_URL:
+        return None
+    if not REDIS_AVAILABLE:
+        logger.warning("REDIS_URL is set but redis is not installed. Install with: pip install redis")
+        return None
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def after_transaction(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Run an async callback once the request's transaction has finished.
+
+    Callbacks run after get_db() commits (or rolls back), so they suit cache
+    invalidation that must not race ahead of the commit. They should be
+    idempotent: they also run after a rollback.
+    """
+    session.info.setdefault("after_transaction", []).append(callback)
+
+
 async def get_db() -> AsyncSession:
     """Dependency to get database session."""
     async with async_session_maker() as session:
@@ -37,6 +142,11 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
+            for callback in session.info.pop("after_transaction", []):
+                try:
+                    await callback()
+                except Exception:
+                    logger.exception("after_transaction callback failed")
             await session.close()
 
 
@@ -62,7 +172,24 @@ async def init_db():
     # Schema creation is handled by Alembic migrations
     # To create tables, run: alembic upgrade head
 
+    await _warm_pool()
+
+
+async def _warm_pool() -> None:
+    """Open DB_POOL_MIN_SIZE connections up front and return them to the pool."""
+    if _IS_SQLITE or settings.DB_NULL_POOL:
+        return
+    size = min(settings.DB_POOL_MIN_SIZE, settings.DB_POOL_SIZE)
+    # Held together so the pool ends up with distinct connections
+    async with AsyncExitStack() as stack:
+        for _ in range(size):
+            await stack.enter_async_context(engine.connect())
+
 
 async def close_db():
     """Close database connections."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
     await engine.dispose()
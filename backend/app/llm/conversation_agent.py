@@ -1,14 +1,21 @@
 """Conversation Agent for English conversation practice."""
 
-import json
-import uuid
-from typing import Any, Optional
+import asyncio
+import logging
+import re
+from functools import lru_cache
+from secrets import token_hex
+from typing import Any, AsyncIterator, Optional
+
+import orjson
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 
 from app.llm.factory import LLMFactory, LLMServiceError
+from app.llm.session_store import get_session_store
 from app.llm.prompts import (
     CONVERSATION_FEEDBACK_PROMPT,
     CONVERSATION_FOLLOWUP_PROMPT,
@@ -24,6 +31,68 @@ from app.llm.prompts import (
     SCENARIO_TEMPLATES,
 )
 
+logger = logging.getLogger(__name__)
+
+# The JSON object in a grammar-check reply, fenced (```json ... ```) or bare
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# The system prompt never changes, so the message object is built once and shared
+_SYSTEM_MESSAGE = SystemMessage(content=CONVERSATION_SYSTEM_PROMPT)
+
+
+@lru_cache(maxsize=256)
+def _join_target_words(target_words: tuple[str, ...]) -> str:
+    """Comma-joined target words; a session's list is the same on every turn."""
+    return ", ".join(target_words)
+
+
+@lru_cache(maxsize=256)
+def _render_opening_prompt(topic: Optional[str], target_words: tuple[str, ...]) -> str:
+    """Render the opening prompt for a topic / word set (cached per combination)."""
+    if not topic and not target_words:
+        return CONVERSATION_OPENING_PROMPT
+    return CONVERSATION_OPENING_WITH_TOPIC_PROMPT.format(
+        topic=topic or "general conversation",
+        target_words=_join_target_words(target_words) if target_words else "none",
+    )
+
+
+# Conversations with fewer user messages than this, or fewer characters written
+# by the user in total, are too short to give feedback on, so generate_feedback
+# answers without an LLM call
+MIN_FEEDBACK_USER_MESSAGES = 3
+MIN_FEEDBACK_USER_CHARS = 60
+
+
+def _unused_words_hint(user_messages: list[str], target_words: Optional[list[str]]) -> str:
+    """Sentence naming the target words the user has not written yet, or ""."""
+    if not target_words:
+        return ""
+    said = " ".join(user_messages).lower()
+    unused = [word for word in target_words if word.lower() not in said]
+    if not unused:
+        return ""
+    return f" Try using these words: {_join_target_words(tuple(unused))}."
+
+
+def _short_conversation_feedback(
+    user_messages: list[str], target_words: Optional[list[str]]
+) -> Optional[str]:
+    """Canned feedback for a conversation too short to analyze, else None."""
+    if len(user_messages) < MIN_FEEDBACK_USER_MESSAGES:
+        feedback = (
+            "Not enough conversation yet to provide meaningful feedback. "
+            "Keep chatting for a few more turns!"
+        )
+    elif sum(len(message) for message in user_messages) < MIN_FEEDBACK_USER_CHARS:
+        feedback = (
+            "Your replies so far are very short. "
+            "Try answering in full sentences so there is more to give feedback on."
+        )
+    else:
+        return None
+    return feedback + _unused_words_hint(user_messages, target_words)
+
 
 class ConversationState(dict):
     """State for conversation workflow."""
@@ -35,9 +104,21 @@ class ConversationState(dict):
     correction: Optional[dict]
 
 
+async def _analyze_and_reply_node(state: dict, config: RunnableConfig) -> dict:
+    return await config["configurable"]["agent"]._analyze_and_reply(state)
+
+
+async def _generate_follow_up_node(state: dict, config: RunnableConfig) -> dict:
+    return await config["configurable"]["agent"]._generate_follow_up(state)
+
+
 class ConversationAgent:
     """Agent for handling English conversation practice."""
 
+    # The workflow topology is the same for every agent, so it is compiled once
+    # and shared; the running agent is passed in config["configurable"]["agent"]
+    _graph: Any = None
+
     def __init__(self, llm: Optional[BaseChatModel] = None):
         """
         Initialize conversation agent.
@@ -46,22 +127,22 @@ class ConversationAgent:
             llm: Optional LLM instance, creates default if not provided
         """
         self.llm = llm or LLMFactory.create()
-        self.graph = self._build_graph()
 
-    def _build_graph(self) -> Any:
-        """Build LangGraph workflow for conversation."""
-        workflow = StateGraph(dict)
+    @classmethod
+    def _get_graph(cls) -> Any:
+        """Get the LangGraph workflow for conversation, compiling it on first use."""
+        if cls._graph is None:
+            workflow = StateGraph(dict)
 
-        workflow.add_node("analyze_grammar", self._analyze_grammar)
-        workflow.add_node("generate_reply", self._generate_reply)
-        workflow.add_node("generate_follow_up", self._generate_follow_up)
+            workflow.add_node("analyze_and_reply", _analyze_and_reply_node)
+            workflow.add_node("generate_follow_up", _generate_follow_up_node)
 
-        workflow.set_entry_point("analyze_grammar")
-        workflow.add_edge("analyze_grammar", "generate_reply")
-        workflow.add_edge("generate_reply", "generate_follow_up")
-        workflow.add_edge("generate_follow_up", END)
+            workflow.set_entry_point("analyze_and_reply")
+            workflow.add_edge("analyze_and_reply", "generate_follow_up")
+            workflow.add_edge("generate_follow_up", END)
 
-        return workflow.compile()
+            cls._graph = workflow.compile()
+        return cls._graph
 
     def _format_history(self, messages: list[dict]) -> str:
         """Format conversation history for prompts."""
@@ -79,93 +160,105 @@ class ConversationAgent:
         """Analyze user message for grammar mistakes."""
         user_message = state.get("user_message", "")
 
+        prompt = GRAMMAR_CHECK_PROMPT.format(message=user_message)
         try:
-            prompt = GRAMMAR_CHECK_PROMPT.format(message=user_message)
             response = await self.llm.ainvoke([HumanMessage(content=prompt)])
-
-            # Parse JSON response
-            content = response.content.strip()
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-
-            result = json.loads(content)
-
-            if result.get("has_error"):
-                state["correction"] = {
-                    "original": result.get("original", ""),
-                    "corrected": result.get("corrected", ""),
-                    "explanation": result.get("explanation", ""),
-                }
-            else:
-                state["correction"] = None
-
-        except (json.JSONDecodeError, Exception):
-            # If parsing fails, assume no grammar errors
+        except Exception as e:
+            # The check is optional: the turn goes on without a correction
+            logger.warning(f"Grammar check failed: {e}")
             state["correction"] = None
+            return state
+
+        state["correction"] = self._parse_grammar_result(response.content)
 
         return state
 
-    async def _generate_reply(self, state: dict) -> dict:
-        """Generate conversational reply."""
+    @staticmethod
+    def _parse_grammar_result(content: str) -> Optional[dict]:
+        """Turn the grammar-check reply into a correction dict, or None."""
+        match = _JSON_FENCE_RE.search(content)
+        payload = (match.group(1) or match.group(2)) if match else content
+
+        try:
+            result = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # If parsing fails, assume no grammar errors
+            return None
+
+        if not isinstance(result, dict) or not result.get("has_error"):
+            return None
+        return {
+            "original": result.get("original", ""),
+            "corrected": result.get("corrected", ""),
+            "explanation": result.get("explanation", ""),
+        }
+
+    def _state_history(self, state: dict) -> str:
+        """Formatted history for the state, computed once per turn."""
+        history = state.get("history_text")
+        if history is None:
+            history = state["history_text"] = self._format_history(state.get("messages", []))
+        return history
+
+    def _build_reply_prompt(self, state: dict) -> list:
+        """Build the reply prompt messages for the current state.
+
+        The reply is generated alongside the grammar check, so it never sees the
+        correction; the client receives that separately as "correction".
+        """
         user_message = state.get("user_message", "")
-        messages = state.get("messages", [])
-        correction = state.get("correction")
         target_words = state.get("target_words", [])
 
-        history = self._format_history(messages)
-
-        correction_context = ""
-        if correction:
-            correction_context = (
-                f"Note: The user made a grammar mistake. "
-                f"'{correction['original']}' should be '{correction['corrected']}'. "
-                f"You may gently acknowledge this in your reply if appropriate."
-            )
+        history = self._state_history(state)
 
         # Use word-focused prompt if target words exist
         if target_words:
             prompt = CONVERSATION_REPLY_WITH_WORDS_PROMPT.format(
                 history=history,
                 message=user_message,
-                correction_context=correction_context,
-                target_words=", ".join(target_words),
+                correction_context="",
+                target_words=_join_target_words(tuple(target_words)),
             )
         else:
             prompt = CONVERSATION_REPLY_PROMPT.format(
                 history=history,
                 message=user_message,
-                correction_context=correction_context,
+                correction_context="",
             )
 
-        try:
-            response = await self.llm.ainvoke([
-                SystemMessage(content=CONVERSATION_SYSTEM_PROMPT),
-                HumanMessage(content=prompt),
-            ])
-            state["assistant_reply"] = response.content.strip()
-        except Exception as e:
-            raise LLMServiceError(f"Failed to generate reply: {str(e)}")
-
-        return state
+        return [_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
 
-    async def _generate_follow_up(self, state: dict) -> dict:
-        """Generate follow-up question."""
-        messages = state.get("messages", [])
+    def _build_follow_up_prompt(self, state: dict) -> list:
+        """Build the follow-up prompt messages for the current state."""
         reply = state.get("assistant_reply", "")
 
-        history = self._format_history(messages)
+        history = self._state_history(state)
 
         prompt = CONVERSATION_FOLLOWUP_PROMPT.format(
             history=history,
             reply=reply,
         )
+        return [HumanMessage(content=prompt)]
 
+    async def _generate_reply(self, state: dict) -> dict:
+        """Generate conversational reply."""
         try:
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            response = await self.llm.ainvoke(self._build_reply_prompt(state))
+            state["assistant_reply"] = response.content.strip()
+        except Exception as e:
+            raise LLMServiceError(f"Failed to generate reply: {str(e)}")
+
+        return state
+
+    async def _analyze_and_reply(self, state: dict) -> dict:
+        """Check grammar and generate the reply concurrently (independent LLM calls)."""
+        await asyncio.gather(self._analyze_grammar(state), self._generate_reply(state))
+        return state
+
+    async def _generate_follow_up(self, state: dict) -> dict:
+        """Generate follow-up question."""
+        try:
+            response = await self.llm.ainvoke(self._build_follow_up_prompt(state))
             state["follow_up"] = response.content.strip()
         except Exception as e:
             # Follow-up is optional, use empty string on failure
@@ -200,7 +293,9 @@ class ConversationAgent:
         }
 
         try:
-            result = await self.graph.ainvoke(initial_state)
+            result = await self._get_graph().ainvoke(
+                initial_state, config={"configurable": {"agent": self}}
+            )
 
             response = {
                 "reply": result.get("assistant_reply", ""),
@@ -215,27 +310,91 @@ class ConversationAgent:
         except Exception as e:
             raise LLMServiceError(f"Conversation processing failed: {str(e)}")
 
+    async def stream_message(
+        self,
+        user_message: str,
+        conversation_history: list[dict],
+        target_words: Optional[list[str]] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Process user message, streaming the reply as it is generated.
+
+        Runs the same steps as process_message(), but yields events instead
+        of returning one result:
+        {"type": "reply", "delta": str} chunks of the reply,
+        {"type": "followUp", "delta": str} chunks of the follow-up question,
+        and a final {"type": "done", "reply", "followUp", "correction"}.
+        """
+        state = {
+            "messages": conversation_history,
+            "user_message": user_message,
+            "assistant_reply": "",
+            "follow_up": "",
+            "correction": None,
+            "target_words": target_words or [],
+        }
+
+        # The grammar check runs while the reply streams
+        grammar_task = asyncio.create_task(self._analyze_grammar(state))
+        try:
+            reply_parts = []
+            try:
+                async for chunk in self.llm.astream(self._build_reply_prompt(state)):
+                    if chunk.content:
+                        reply_parts.append(chunk.content)
+                        yield {"type": "reply", "delta": chunk.content}
+            except Exception as e:
+                raise LLMServiceError(f"Failed to generate reply: {str(e)}")
+            state["assistant_reply"] = "".join(reply_parts).strip()
+
+            follow_up_parts = []
+            try:
+                async for chunk in self.llm.astream(self._build_follow_up_prompt(state)):
+                    if chunk.content:
+                        follow_up_parts.append(chunk.content)
+                        yield {"type": "followUp", "delta": chunk.content}
+            except Exception:
+                # Follow-up is optional, keep whatever was streamed
+                pass
+            state["follow_up"] = "".join(follow_up_parts).strip()
+
+            await grammar_task
+        finally:
+            # Client gone or reply failed: the grammar result is not needed
+            grammar_task.cancel()
+
+        done = {
+            "type": "done",
+            "reply": state["assistant_reply"],
+            "followUp": state["follow_up"],
+        }
+        if state["correction"]:
+            done["correction"] = state["correction"]
+        yield done
+
     async def generate_opening(
         self, topic: Optional[str] = None, target_words: Optional[list[str]] = None
     ) -> str:
         """Generate opening message for new conversation."""
         try:
-            if topic or target_words:
-                prompt = CONVERSATION_OPENING_WITH_TOPIC_PROMPT.format(
-                    topic=topic or "general conversation",
-                    target_words=", ".join(target_words) if target_words else "none",
-                )
-            else:
-                prompt = CONVERSATION_OPENING_PROMPT
-                
-            response = await self.llm.ainvoke([
-                SystemMessage(content=CONVERSATION_SYSTEM_PROMPT),
-                HumanMessage(content=prompt),
-            ])
+            prompt = _render_opening_prompt(topic, tuple(target_words or ()))
+            response = await self.llm.ainvoke([_SYSTEM_MESSAGE, HumanMessage(content=prompt)])
             return response.content.strip()
         except Exception as e:
             raise LLMServiceError(f"Failed to generate opening: {str(e)}")
 
+    async def stream_opening(
+        self, topic: Optional[str] = None, target_words: Optional[list[str]] = None
+    ) -> AsyncIterator[str]:
+        """Generate the opening message, yielding text chunks as they arrive."""
+        prompt = _render_opening_prompt(topic, tuple(target_words or ()))
+        try:
+            async for chunk in self.llm.astream([_SYSTEM_MESSAGE, HumanMessage(content=prompt)]):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            raise LLMServiceError(f"Failed to generate opening: {str(e)}")
+
     async def generate_feedback(
         self, messages: list[dict], target_words: Optional[list[str]] = None
     ) -> str:
@@ -252,100 +411,111 @@ class ConversationAgent:
         if not messages:
             return "No conversation to analyze."
 
+        user_messages = [m.get("content", "") for m in messages if m.get("role") == "user"]
+        canned = _short_conversation_feedback(user_messages, target_words)
+        if canned is not None:
+            return canned
+
         conversation = self._format_history(messages)
         prompt = CONVERSATION_FEEDBACK_PROMPT.format(
             conversation=conversation,
-            target_words=", ".join(target_words) if target_words else "none specified",
+            target_words=_join_target_words(tuple(target_words)) if target_words else "none specified",
         )
 
         try:
-            response = await self.llm.ainvoke([
-                SystemMessage(content=CONVERSATION_SYSTEM_PROMPT),
-                HumanMessage(content=prompt),
-            ])
+            response = await self.llm.ainvoke([_SYSTEM_MESSAGE, HumanMessage(content=prompt)])
             return response.content.strip()
         except Exception as e:
             raise LLMServiceError(f"Failed to generate feedback: {str(e)}")
 
 
-# Session storage for conversation history (in-memory for now)
-# Each session stores: {"messages": [...], "topic": str, "target_words": [...], "scenario": str or None}
-_conversation_sessions: dict[str, dict] = {}
+# Session storage for conversation history (Redis when configured, else in-process)
+# Each session stores its messages plus context: {"topic": str, "target_words": [...], "scenario": str or None}
 
 
-def get_session(session_id: str) -> list[dict]:
+async def get_session(session_id: str) -> list[dict]:
     """Get conversation history for a session."""
-    session = _conversation_sessions.get(session_id, {})
-    return session.get("messages", [])
+    return await get_session_store().get_messages(session_id)
 
 
-def get_session_context(session_id: str) -> dict:
+async def get_session_context(session_id: str) -> dict:
     """Get session context including topic, target words, and scenario."""
-    session = _conversation_sessions.get(session_id, {})
-    return {
-        "topic": session.get("topic"),
-        "target_words": session.get("target_words", []),
-        "scenario": session.get("scenario"),
-    }
+    return await get_session_store().get_context(session_id)
 
 
-def create_session(
+async def get_session_full(session_id: str) -> tuple[list[dict], dict]:
+    """Get conversation history and session context in a single store access."""
+    return await get_session_store().get_full(session_id)
+
+
+async def create_session(
     topic: Optional[str] = None, 
     target_words: Optional[list[str]] = None,
-    scenario: Optional[str] = None
+    scenario: Optional[str] = None,
+    opening_message: Optional[str] = None,
 ) -> str:
-    """Create a new conversation session with optional context."""
-    session_id = str(uuid.uuid4())
-    
+    """Create a new conversation session with optional context and opening message."""
     # If scenario is specified, use scenario-specific vocabulary
     if scenario and scenario in SCENARIO_TEMPLATES:
         scenario_data = SCENARIO_TEMPLATES[scenario]
         target_words = scenario_data.get("vocabulary", [])
-    
-    _conversation_sessions[session_id] = {
-        "messages": [],
+
+    messages = [_make_message("assistant", opening_message)] if opening_message else None
+    return await get_session_store().create({
         "topic": topic,
         "target_words": target_words or [],
         "scenario": scenario,
-    }
-    return session_id
-
+    }, messages)
 
-def add_message(session_id: str, role: str, content: str, correction: Optional[dict] = None):
-    """Add a message to a session."""
-    if session_id not in _conversation_sessions:
-        _conversation_sessions[session_id] = {"messages": [], "topic": None, "target_words": [], "scenario": None}
 
+def _make_message(role: str, content: str, correction: Optional[dict] = None) -> dict:
     message = {
-        "id": str(uuid.uuid4()),
+        "id": token_hex(16),
         "role": role,
         "content": content,
     }
     if correction:
         message["correction"] = correction
+    return message
 
-    _conversation_sessions[session_id]["messages"].append(message)
 
+async def add_message(session_id: str, role: str, content: str, correction: Optional[dict] = None):
+    """Add a message to a session."""
+    await get_session_store().append_messages(session_id, [_make_message(role, content, correction)])
+
+
+async def add_exchange(
+    session_id: str, user_message: str, assistant_reply: str, correction: Optional[dict] = None
+):
+    """Atomically add a user message and the assistant's reply to a session."""
+    await get_session_store().append_messages(session_id, [
+        _make_message("user", user_message, correction),
+        _make_message("assistant", assistant_reply),
+    ])
 
-def clear_session(session_id: str):
+
+async def clear_session(session_id: str):
     """Clear a conversation session."""
-    if session_id in _conversation_sessions:
-        del _conversation_sessions[session_id]
+    await get_session_store().delete(session_id)
+
+
+# Scenario templates are static, so the public listing is built once at import
+_AVAILABLE_SCENARIOS = tuple(
+    {
+        "id": scenario_id,
+        "name": data["name"],
+        "role": data["role"],
+        "userRole": data["user_role"],
+        "userGoal": data["user_goal"],
+        "vocabulary": data["vocabulary"],
+    }
+    for scenario_id, data in SCENARIO_TEMPLATES.items()
+)
 
 
 def get_available_scenarios() -> list[dict]:
     """Get list of available scenarios with their details."""
-    scenarios = []
-    for scenario_id, data in SCENARIO_TEMPLATES.items():
-        scenarios.append({
-            "id": scenario_id,
-            "name": data["name"],
-            "role": data["role"],
-            "userRole": data["user_role"],
-            "userGoal": data["user_goal"],
-            "vocabulary": data["vocabulary"],
-        })
-    return scenarios
+    return list(_AVAILABLE_SCENARIOS)
 
 
 def get_scenario_opening(scenario_id: str) -> Optional[str]:
@@ -1,13 +1,37 @@
 """LLM Factory for creating LLM instances based on configuration."""
 
-from functools import lru_cache
+import hashlib
 from typing import Optional
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_mistralai import ChatMistralAI
 
 from app.config import settings
+from app.llm.http_client import create_async_client, get_http_client
+from app.utils.async_ttl_cache import async_ttl_cache
+from app.utils.cache import TTLCache
+
+# Provider model lists rarely change; successful listings are reused for this long
+MODELS_CACHE_TTL_SECONDS = 300
+
+
+# Built chat models (and the provider HTTP clients they hold) are reused per
+# (provider, key, model, temperature) so BYOK requests keep warm connections
+LLM_CLIENT_CACHE_SIZE = 256
+LLM_CLIENT_TTL_SECONDS = 3600
+
+_llm_clients = TTLCache(maxsize=LLM_CLIENT_CACHE_SIZE, ttl=LLM_CLIENT_TTL_SECONDS)
+
+
+def _key_digest(api_key: str) -> bytes:
+    # Keep only a digest of the key in memory
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
+
+def _models_cache_key(provider: str, api_key: str) -> tuple[str, bytes]:
+    return provider, _key_digest(api_key)
 
 
 class LLMServiceError(Exception):
@@ -33,6 +57,9 @@ class LLMFactory:
         """
         Create LLM instance based on configuration.
 
+        Instances are cached per (provider, API key digest, model, temperature),
+        so repeat calls with the same settings return the same client.
+
         Args:
             provider: "gemini" or "mistral", defaults to config setting
             api_key: Optional user-provided API key
@@ -54,10 +81,17 @@ class LLMFactory:
                 f"Supported providers: {LLMFactory.SUPPORTED_PROVIDERS}"
             )
 
+        cache_key = (provider, _key_digest(api_key) if api_key else None, model, temperature)
+        llm = _llm_clients.get(cache_key)
+        if llm is not None:
+            return llm
+
         if provider == "gemini":
-            return LLMFactory._create_gemini(temperature, api_key, model)
+            llm = LLMFactory._create_gemini(temperature, api_key, model)
         elif provider == "mistral":
-            return LLMFactory._create_mistral(temperature, api_key, model)
+            llm = LLMFactory._create_mistral(temperature, api_key, model)
+        _llm_clients.set(cache_key, llm)
+        return llm
 
     @staticmethod
     def _create_gemini(
@@ -92,16 +126,33 @@ class LLMFactory:
                 "Mistral API key not configured. Please set MISTRAL_API_KEY environment variable or provide a key."
             )
 
+        # Async calls go through the shared connection pool
+        async_client = create_async_client(
+            base_url=settings.MISTRAL_BASE_URL,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Authorization": f"Bearer {final_api_key}",
+            },
+            timeout=120,
+        )
+
         return ChatMistralAI(
             model=model or "mistral-large-latest",
             mistral_api_key=final_api_key,
             temperature=temperature,
+            endpoint=settings.MISTRAL_BASE_URL,
+            async_client=async_client,
         )
 
     @staticmethod
-    def list_models(provider: str, api_key: str) -> list[dict]:
+    @async_ttl_cache(MODELS_CACHE_TTL_SECONDS, key=_models_cache_key)
+    async def list_models(provider: str, api_key: str) -> list[dict]:
         """
         List available models for a provider.
+
+        Results are cached per (provider, API key) for MODELS_CACHE_TTL_SECONDS;
+        failures are not cached.
         
         Args:
             provider: "gemini" or "mistral"
@@ -112,9 +163,9 @@ class LLMFactory:
         """
         try:
             if provider == "gemini":
-                return LLMFactory._list_gemini_models(api_key)
+                return await LLMFactory._list_gemini_models(api_key)
             elif provider == "mistral":
-                return LLMFactory._list_mistral_models(api_key)
+                return await LLMFactory._list_mistral_models(api_key)
         except Exception as e:
             # Log error but return empty list or raise specific error
             print(f"Error listing models for {provider}: {str(e)}")
@@ -123,12 +174,10 @@ class LLMFactory:
         return []
 
     @staticmethod
-    def _list_gemini_models(api_key: str) -> list[dict]:
+    async def _list_gemini_models(api_key: str) -> list[dict]:
         """List Gemini models via REST API."""
-        import requests
-        
-        url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
-        response = requests.get(url, timeout=10)
+        url = "https://generativelanguage.googleapis.com/v1beta/models"
+        response = await get_http_client().get(url, params={"key": api_key}, timeout=10)
         
         if response.status_code != 200:
             raise ValueError(f"Google API Error: {response.text}")
@@ -150,17 +199,15 @@ class LLMFactory:
         return sorted(models, key=lambda x: x["id"], reverse=True)
 
     @staticmethod
-    def _list_mistral_models(api_key: str) -> list[dict]:
+    async def _list_mistral_models(api_key: str) -> list[dict]:
         """List Mistral models via REST API."""
-        import requests
-        
-        url = "https://api.mistral.ai/v1/models"
+        url = f"{settings.MISTRAL_BASE_URL}/models"
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json"
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await get_http_client().get(url, headers=headers, timeout=10)
         
         if response.status_code != 200:
             raise ValueError(f"Mistral API Error: {response.text}")
@@ -188,14 +235,24 @@ class LLMFactory:
         return available
 
 
-@lru_cache
+def json_mode(llm: BaseChatModel) -> Runnable:
+    """
+    Bind an LLM to return a bare JSON object instead of free text.
+
+    Both providers accept an OpenAI-style response_format (Gemini maps it to
+    response_mime_type="application/json"), so replies come back without
+    markdown fences or surrounding prose.
+    """
+    return llm.bind(response_format={"type": "json_object"})
+
+
 def get_llm(
     provider: Optional[str] = None,
     api_key: Optional[str] = None,
     model: Optional[str] = None
 ) -> BaseChatModel:
     """
-    Get cached LLM instance.
+    Get cached LLM instance (LLMFactory.create caches by key digest).
 
     Args:
         provider: Optional provider override
@@ -208,6 +265,26 @@ def get_llm(
     return LLMFactory.create(provider, api_key, model)
 
 
+# The resolved active config is cached briefly so hot paths skip the DB lookup.
+# Admin changes to AI providers call invalidate_llm_config() to drop it at once.
+ACTIVE_CONFIG_TTL_SECONDS = 30
+
+_active_config_cache = TTLCache(maxsize=1, ttl=ACTIVE_CONFIG_TTL_SECONDS)
+_llm_config_version = 0
+
+
+def get_llm_config_version() -> int:
+    """Get a counter that changes whenever AI provider settings change."""
+    return _llm_config_version
+
+
+def invalidate_llm_config() -> None:
+    """Forget the cached active config after AI provider settings change."""
+    global _llm_config_version
+    _llm_config_version += 1
+    _active_config_cache.clear()
+
+
 async def get_active_llm_config(db) -> dict:
     """
     Get the active LLM configuration from DB or fallback to ENV.
@@ -220,6 +297,15 @@ async def get_active_llm_config(db) -> dict:
     Returns:
         Dict with provider_type, api_key, model, and source
     """
+    config = _active_config_cache.get("active")
+    if config is None:
+        config = await _load_active_llm_config(db)
+        _active_config_cache.set("active", config)
+    return dict(config)
+
+
+async def _load_active_llm_config(db) -> dict:
+    """Resolve the active LLM configuration without caching."""
     from app.services.ai_settings_service import AISettingsService
     
     service = AISettingsService(db)
@@ -1,7 +1,7 @@
 """Game Question Agent for AI-powered question generation."""
 
 import json
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
@@ -65,6 +65,29 @@ class GameQuestionAgent:
 
         return json.loads(content)
 
+    @staticmethod
+    def _drain_json_objects(buffer: str, pos: int) -> tuple[list[dict], int]:
+        """
+        Decode every complete JSON object in ``buffer`` starting at ``pos``.
+
+        Used while streaming: objects are decoded as soon as their closing
+        brace arrives, and the position of the first incomplete one is
+        returned so decoding can resume when more text is available.
+        """
+        decoder = json.JSONDecoder()
+        objects = []
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer) or buffer[pos] != "{":
+                return objects, pos
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                return objects, pos
+            objects.append(obj)
+            pos = end
+
     def _get_prompt_for_type(self, game_type: str, count: int, exclude_words: set = None) -> str:
         """Get the appropriate prompt for the game type."""
         prompts = {
@@ -137,6 +160,66 @@ class GameQuestionAgent:
                 raise
             raise LLMServiceError(f"Question generation failed: {str(e)}")
 
+    async def stream_questions(
+        self, game_type: str, count: int = 5, exclude_words: set = None
+    ) -> AsyncIterator[dict]:
+        """
+        Generate game questions using AI, yielding each one as soon as the
+        LLM has finished writing it.
+
+        Args:
+            game_type: Type of game
+            count: Number of questions to generate
+            exclude_words: Set of words to exclude (already exist in database)
+
+        Yields:
+            Question dictionaries
+        """
+        if game_type not in self.SUPPORTED_GAME_TYPES:
+            raise ValueError(
+                f"Unsupported game type: {game_type}. "
+                f"Supported types: {self.SUPPORTED_GAME_TYPES}"
+            )
+
+        prompt = self._get_prompt_for_type(game_type, count, exclude_words)
+
+        buffer = ""
+        pos = None  # Index just past the opening "[" once it has been seen
+        is_array = None
+        yielded = 0
+
+        try:
+            async for chunk in self.llm.astream([HumanMessage(content=prompt)]):
+                if not isinstance(chunk.content, str):
+                    continue
+                buffer += chunk.content
+                if is_array is None:
+                    start = next((i for i, c in enumerate(buffer) if c in "[{"), None)
+                    if start is None:
+                        continue
+                    is_array = buffer[start] == "["
+                    pos = start + 1
+                if not is_array:
+                    continue
+                objects, pos = self._drain_json_objects(buffer, pos)
+                for obj in objects:
+                    yielded += 1
+                    yield obj
+
+            # Model answered with a single object (or something the incremental
+            # decoder could not follow) - fall back to parsing the whole reply
+            if yielded == 0:
+                result = self._parse_json_response(buffer)
+                for obj in [result] if isinstance(result, dict) else result:
+                    yield obj
+
+        except json.JSONDecodeError:
+            raise LLMServiceError("Failed to parse question response: Invalid JSON")
+        except Exception as e:
+            if isinstance(e, (LLMServiceError, ValueError)):
+                raise
+            raise LLMServiceError(f"Question generation failed: {str(e)}")
+
 
 # Singleton instance
 _game_question_agent: Optional[GameQuestionAgent] = None
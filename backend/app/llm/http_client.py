@@ -0,0 +1,62 @@
+"""Shared HTTP connection pool for calls to LLM providers.
+
+Mistral chat traffic and the provider model listings go through one pooled
+transport, so TCP/TLS connections are kept alive and reused across requests
+instead of being set up per call. Provider clients that need their own base
+URL or credentials are created with create_async_client() and still share the
+same pool. Gemini chat models are the exception: langchain-google-genai builds
+its own google-genai HTTP clients, which stay warm per cached model instance
+(see LLMFactory.create).
+"""
+
+from typing import Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+HTTP_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=256)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_transport: Optional[httpx.AsyncHTTPTransport] = None
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_transport() -> httpx.AsyncHTTPTransport:
+    """Get the process-wide pooled transport."""
+    global _transport
+    if _transport is None:
+        _transport = httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE)
+    return _transport
+
+
+def create_async_client(**kwargs) -> httpx.AsyncClient:
+    """Create an AsyncClient (e.g. with its own base_url/headers) on the shared pool.
+
+    Clients created here must not be closed individually - closing one would
+    close the shared transport. close_http_client() handles shutdown.
+    """
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return httpx.AsyncClient(transport=get_async_transport(), **kwargs)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for one-off provider requests."""
+    global _client
+    if _client is None:
+        _client = create_async_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _client, _transport
+    if _transport is not None:
+        await _transport.aclose()
+    _client = None
+    _transport = None
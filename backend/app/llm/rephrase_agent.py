@@ -6,7 +6,7 @@ from typing import Optional, List
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 
-from app.llm.factory import LLMFactory, LLMServiceError
+from app.llm.factory import LLMFactory, LLMServiceError, json_mode
 from app.llm.prompts import REPHRASE_ANALYSIS_PROMPT
 
 
@@ -163,7 +163,7 @@ class RephraseAgent:
         prompt = REPHRASE_ANALYSIS_PROMPT.format(sentence=sentence)
 
         try:
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            response = await json_mode(self.llm).ainvoke([HumanMessage(content=prompt)])
             content = response.content
 
             # Parse JSON response
@@ -0,0 +1,120 @@
+"""Response cache for conversation LLM calls.
+
+Replies are keyed by the exact user message plus the last few turns of
+history, the target words and the scenario, so identical conversation states
+reuse an earlier LLM answer instead of calling the provider again. Scenario
+conversations get their own namespace so they never collide with free-form
+ones, and every key includes the provider and model that produced the answer.
+
+Openings are only cached for a topic or word set: without one the prompt asks
+the model to pick a topic, and a cached answer would give every user the same
+one. The cache is off unless LLM_RESPONSE_CACHE_TTL is set above 0.
+"""
+
+import hashlib
+from typing import Optional
+
+from langchain_core.language_models import BaseChatModel
+
+from app.config import settings
+from app.utils.cache import get_cache
+
+# Number of previous turns that take part in the cache key
+HISTORY_TURNS = 4
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial differences still hit."""
+    return " ".join(text.lower().split())
+
+
+def _llm_scope(llm: BaseChatModel) -> str:
+    """Provider and model of an LLM, so answers are never shared across models."""
+    return f"{type(llm).__name__}:{getattr(llm, 'model', '')}"
+
+
+def _cache_key(kind: str, namespace: str, *parts: str) -> str:
+    digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+    return f"llm:{kind}:{namespace}:{digest}"
+
+
+def _reply_key(
+    llm: BaseChatModel,
+    message: str, history: list[dict], target_words: list[str], scenario: Optional[str]
+) -> str:
+    turns = [f"{m.get('role')}:{_normalize(m.get('content', ''))}" for m in history[-HISTORY_TURNS:]]
+    return _cache_key(
+        "reply",
+        scenario or "free",
+        _llm_scope(llm),
+        # Exact text: the cached result carries the grammar correction, which
+        # depends on capitalization and spacing
+        message,
+        "\n".join(turns),
+        ",".join(sorted(w.lower() for w in target_words)),
+    )
+
+
+def _opening_key(
+    llm: BaseChatModel, topic: Optional[str], target_words: Optional[list[str]]
+) -> str:
+    return _cache_key(
+        "opening",
+        "free",
+        _llm_scope(llm),
+        _normalize(topic or ""),
+        ",".join(sorted(w.lower() for w in target_words or [])),
+    )
+
+
+def _opening_cacheable(topic: Optional[str], target_words: Optional[list[str]]) -> bool:
+    """Whether an opening may be reused: only when it has a topic or word set."""
+    return settings.LLM_RESPONSE_CACHE_TTL > 0 and bool(topic or target_words)
+
+
+async def get_cached_reply(
+    llm: BaseChatModel,
+    message: str, history: list[dict], target_words: list[str], scenario: Optional[str]
+) -> Optional[dict]:
+    """Get a cached process_message() result for this conversation state."""
+    if settings.LLM_RESPONSE_CACHE_TTL <= 0:
+        return None
+    return await get_cache().get(_reply_key(llm, message, history, target_words, scenario))
+
+
+async def cache_reply(
+    llm: BaseChatModel,
+    message: str,
+    history: list[dict],
+    target_words: list[str],
+    scenario: Optional[str],
+    result: dict,
+) -> None:
+    """Store a process_message() result for this conversation state."""
+    if settings.LLM_RESPONSE_CACHE_TTL <= 0:
+        return
+    await get_cache().set(
+        _reply_key(llm, message, history, target_words, scenario),
+        result,
+        ttl=settings.LLM_RESPONSE_CACHE_TTL,
+    )
+
+
+async def get_cached_opening(
+    llm: BaseChatModel, topic: Optional[str], target_words: Optional[list[str]]
+) -> Optional[str]:
+    """Get a cached opening message for this topic and word set."""
+    if not _opening_cacheable(topic, target_words):
+        return None
+    return await get_cache().get(_opening_key(llm, topic, target_words))
+
+
+async def cache_opening(
+    llm: BaseChatModel, topic: Optional[str], target_words: Optional[list[str]], opening: str
+) -> None:
+    """Store an opening message for this topic and word set."""
+    if not _opening_cacheable(topic, target_words):
+        return
+    await get_cache().set(
+        _opening_key(llm, topic, target_words), opening, ttl=settings.LLM_RESPONSE_CACHE_TTL
+    )
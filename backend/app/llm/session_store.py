@@ -0,0 +1,158 @@
+"""Conversation session storage.
+
+Sessions live in Redis when REDIS_URL is configured so that every worker sees
+the same history; otherwise they fall back to a bounded in-process cache with
+the same TTL semantics.
+"""
+
+import os
+import time
+import uuid
+from typing import Any, Optional
+
+import orjson
+
+from app.database import get_redis
+from app.utils.cache import TTLCache
+
+# Idle sessions expire after this many seconds
+SESSION_TTL_SECONDS = 3600
+# Upper bound on sessions held by the in-process store
+SESSION_MAX_IN_MEMORY = 10_000
+
+
+def new_session_id() -> str:
+    """
+    Generate a UUIDv7 session id (RFC 9562) as 32 hex chars.
+
+    The leading 48 bits are the Unix time in milliseconds, so ids sort by
+    creation time; the rest is random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value).hex
+
+
+def _empty_context() -> dict:
+    return {"topic": None, "target_words": [], "scenario": None}
+
+
+class InMemorySessionStore:
+    """Process-local session store: a bounded LRU with sliding TTL expiry.
+
+    Appending to a session renews its TTL; once SESSION_MAX_IN_MEMORY sessions
+    are held the least recently used one is dropped, so memory stays bounded.
+    """
+
+    def __init__(self, ttl: int = SESSION_TTL_SECONDS, maxsize: int = SESSION_MAX_IN_MEMORY):
+        self.ttl = ttl
+        self._sessions = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def create(self, context: dict, messages: Optional[list[dict]] = None) -> str:
+        session_id = new_session_id()
+        self._sessions.set(session_id, {"messages": list(messages or ()), "context": context})
+        return session_id
+
+    async def get_messages(self, session_id: str) -> list[dict]:
+        session = self._sessions.get(session_id)
+        return list(session["messages"]) if session else []
+
+    async def get_context(self, session_id: str) -> dict:
+        session = self._sessions.get(session_id)
+        return dict(session["context"]) if session else _empty_context()
+
+    async def get_full(self, session_id: str) -> tuple[list[dict], dict]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return [], _empty_context()
+        return list(session["messages"]), dict(session["context"])
+
+    async def append_messages(self, session_id: str, messages: list[dict]) -> None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = {"messages": [], "context": _empty_context()}
+        session["messages"].extend(messages)
+        # Re-setting renews the TTL
+        self._sessions.set(session_id, session)
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """Redis-backed session store shared by all workers.
+
+    Messages are kept in a list at ``conv:{<id>}`` and the session context in a
+    JSON string at ``conv:{<id>}:ctx``; both keys share the same TTL. The braces
+    are a Redis Cluster hash tag, so a session's keys always live in one slot
+    (required for the MULTI/EXEC append) while sessions spread across slots.
+    """
+
+    def __init__(self, redis: Any, ttl: int = SESSION_TTL_SECONDS):
+        self.redis = redis
+        self.ttl = ttl
+
+    @staticmethod
+    def _messages_key(session_id: str) -> str:
+        return f"conv:{{{session_id}}}"
+
+    @staticmethod
+    def _context_key(session_id: str) -> str:
+        return f"conv:{{{session_id}}}:ctx"
+
+    async def create(self, context: dict, messages: Optional[list[dict]] = None) -> str:
+        session_id = new_session_id()
+        if not messages:
+            await self.redis.set(self._context_key(session_id), orjson.dumps(context), ex=self.ttl)
+            return session_id
+
+        # Context and initial messages in one round-trip
+        messages_key = self._messages_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._context_key(session_id), orjson.dumps(context), ex=self.ttl)
+            pipe.rpush(messages_key, *(orjson.dumps(m) for m in messages))
+            pipe.expire(messages_key, self.ttl)
+            await pipe.execute()
+        return session_id
+
+    async def get_messages(self, session_id: str) -> list[dict]:
+        raw = await self.redis.lrange(self._messages_key(session_id), 0, -1)
+        return [orjson.loads(item) for item in raw]
+
+    async def get_context(self, session_id: str) -> dict:
+        raw = await self.redis.get(self._context_key(session_id))
+        return orjson.loads(raw) if raw else _empty_context()
+
+    async def get_full(self, session_id: str) -> tuple[list[dict], dict]:
+        # Both reads in one round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lrange(self._messages_key(session_id), 0, -1)
+            pipe.get(self._context_key(session_id))
+            raw_messages, raw_context = await pipe.execute()
+        messages = [orjson.loads(item) for item in raw_messages]
+        return messages, orjson.loads(raw_context) if raw_context else _empty_context()
+
+    async def append_messages(self, session_id: str, messages: list[dict]) -> None:
+        messages_key = self._messages_key(session_id)
+        # MULTI/EXEC so a user turn and its reply are appended together
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(messages_key, *(orjson.dumps(m) for m in messages))
+            pipe.expire(messages_key, self.ttl)
+            pipe.expire(self._context_key(session_id), self.ttl)
+            await pipe.execute()
+
+    async def delete(self, session_id: str) -> None:
+        await self.redis.delete(self._messages_key(session_id), self._context_key(session_id))
+
+
+_session_store: Optional[InMemorySessionStore | RedisSessionStore] = None
+
+
+def get_session_store() -> InMemorySessionStore | RedisSessionStore:
+    """Get or create the session store singleton."""
+    global _session_store
+    if _session_store is None:
+        redis = get_redis()
+        _session_store = RedisSessionStore(redis) if redis is not None else InMemorySessionStore()
+    return _session_store
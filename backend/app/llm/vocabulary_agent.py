@@ -1,8 +1,8 @@
 """Vocabulary Agent for word lookup and analysis."""
 
-import json
 from typing import Optional
 
+import orjson
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 
@@ -49,7 +49,7 @@ class VocabularyAgent:
                     break
             content = "\n".join(lines).strip()
 
-        return json.loads(content)
+        return orjson.loads(content)
 
     def _validate_word_definition(self, data: dict) -> dict:
         """
@@ -189,7 +189,7 @@ class VocabularyAgent:
 
             return validated_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise LLMServiceError(
                 f"Failed to parse vocabulary response: Invalid JSON format"
             )
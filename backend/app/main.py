@@ -5,10 +5,17 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from app.config import settings
-from app.database import init_db, close_db
+from app.database import init_db, close_db, get_redis
+from app.llm.factory import LLMServiceError as ProviderLLMServiceError
+from app.llm.http_client import close_http_client
+from app.services.tts_service import close_tts_worker
+from app.services.url_extractor import close_url_extractor
+from app.services.vocabulary_service import close_lookup_counter
 from app.schemas.error import ErrorResponse
+from app.utils.responses import ORJSONResponse
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
 from app.api.conversation import router as conversation_router
@@ -36,6 +43,8 @@ async def lifespan(app: FastAPI):
     
     # Startup
     await init_db()
+    # Create the shared Redis client up front (no-op when REDIS_URL is unset)
+    get_redis()
     
     # Run data seeding during startup if enabled (for demo environments)
     if settings.RUN_SEED_ON_STARTUP:
@@ -56,6 +65,10 @@ async def lifespan(app: FastAPI):
     
     yield
     # Shutdown
+    await close_http_client()
+    await close_url_extractor()
+    await close_lookup_counter()
+    await close_tts_worker()
     await close_db()
 
 
@@ -64,6 +77,7 @@ app = FastAPI(
     description="Backend API for English Learning Application",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware
@@ -140,6 +154,52 @@ async def llm_exception_handler(request: Request, exc: LLMServiceError):
     )
 
 
+@app.exception_handler(ProviderLLMServiceError)
+async def llm_provider_exception_handler(request: Request, exc: ProviderLLMServiceError):
+    """Handle errors raised by the LLM layer (app.llm) that reach the API."""
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": ErrorResponse(
+                error="LLM_SERVICE_ERROR",
+                detail=exc.message,
+                code="LLM_SERVICE_ERROR",
+            ).model_dump(),
+        },
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Fail fast with 503 when no database connection frees up in time."""
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "1"},
+        content={
+            "detail": ErrorResponse(
+                error="DATABASE_BUSY",
+                detail="The service is busy, please retry shortly",
+                code="DATABASE_BUSY",
+            ).model_dump(),
+        },
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Return the standard error envelope for unexpected errors (still logged by the server)."""
+    return JSONResponse(
+        status_code=500,
+        content={
+            "detail": ErrorResponse(
+                error="INTERNAL_ERROR",
+                detail="An unexpected error occurred",
+                code="INTERNAL_ERROR",
+            ).model_dump(),
+        },
+    )
+
+
 # Health check endpoint
 @app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
@@ -148,21 +208,31 @@ async def health_check():
 
 
 # Include routers
-app.include_router(auth_router)
-app.include_router(users_router)
-app.include_router(conversation_router)
-app.include_router(vocabulary_router)
-app.include_router(rephrase_router)
-app.include_router(progress_router)
-app.include_router(game_questions_router)
-app.include_router(wordlist_router)
-app.include_router(notifications_router)
-app.include_router(tts_router)
-app.include_router(srs_router)
-app.include_router(reading_router)
-app.include_router(analytics_router)
-app.include_router(admin_router)
-app.include_router(llm_router)
+_routers = (
+    auth_router,
+    users_router,
+    conversation_router,
+    vocabulary_router,
+    rephrase_router,
+    progress_router,
+    game_questions_router,
+    wordlist_router,
+    notifications_router,
+    tts_router,
+    srs_router,
+    reading_router,
+    analytics_router,
+    admin_router,
+    llm_router,
+)
+
+# Each feature owns exactly one router; a repeated prefix means a module was
+# registered twice and every request under it would walk both route tables.
+_prefixes = [r.prefix for r in _routers]
+assert len(_prefixes) == len(set(_prefixes)), f"Duplicate router prefixes: {_prefixes}"
+
+for _router in _routers:
+    app.include_router(_router)
 
 
 # Serve bundled frontend static files (when installed via pip)
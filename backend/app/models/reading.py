@@ -1,6 +1,6 @@
 """Reading Article database model."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -24,3 +24,8 @@ class ReadingArticle(BaseModel):
     # Relationships
     user = relationship("User", backref="reading_articles")
 
+    __table_args__ = (
+        # Keyset pagination of a user's articles (newest first)
+        Index("ix_reading_articles_user_created", "user_id", "created_at", "id"),
+    )
+
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -28,7 +28,7 @@ class UserWordlist(BaseModel):
 
     # FSRS (Free Spaced Repetition Scheduler) fields
     fsrs_card_json = Column(Text, nullable=True)  # Serialized FSRS Card object
-    fsrs_due = Column(DateTime, nullable=True, index=True)  # Next review datetime
+    fsrs_due = Column(DateTime, nullable=True)  # Next review datetime
     fsrs_state = Column(String(20), nullable=True)  # New, Learning, Review, Relearning
 
     # Relationships
@@ -38,6 +38,14 @@ class UserWordlist(BaseModel):
     # Ensure a user can only add a word once
     __table_args__ = (
         UniqueConstraint("user_id", "vocabulary_cache_id", name="uq_user_vocabulary"),
+        # Per-user due-card lookups; never-scheduled rows are left out
+        Index(
+            "ix_user_wordlist_fsrs_due_active",
+            "user_id",
+            "fsrs_due",
+            postgresql_where=text("fsrs_due IS NOT NULL"),
+            sqlite_where=text("fsrs_due IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
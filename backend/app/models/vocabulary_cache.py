@@ -1,6 +1,7 @@
 """Vocabulary cache database model."""
 
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import JSON, Column, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.models.base import BaseModel
 
@@ -11,7 +12,8 @@ class VocabularyCache(BaseModel):
     __tablename__ = "vocabulary_cache"
 
     word = Column(String(100), unique=True, index=True, nullable=False)
-    definition_json = Column(Text, nullable=False)
+    # Stored as JSONB on PostgreSQL (JSON text elsewhere); loads as a dict
+    definition_json = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
     lookup_count = Column(Integer, default=1, nullable=False)
 
     def __repr__(self) -> str:
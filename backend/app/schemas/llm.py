@@ -1,5 +1,5 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class ModelInfo(BaseModel):
     id: str
@@ -7,4 +7,6 @@ class ModelInfo(BaseModel):
     description: str | None = None
 
 class ModelsListResponse(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True, cache_strings="all")
+
     models: List[ModelInfo]
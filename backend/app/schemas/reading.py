@@ -63,8 +63,11 @@ class ArticleSummary(BaseModel):
 class ArticleListSummaryResponse(BaseModel):
     """Response schema for listing article summaries."""
 
-    total: int
     articles: list[ArticleSummary]
+    has_more: bool = Field(False, description="Whether another page follows")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page; null on the last page"
+    )
 
 
 class UrlImportRequest(BaseModel):
@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.achievement import Achievement, UserAchievement
 from app.models.progress import UserProgress, UserStreak
+from app.services.progress_service import PROGRESS_CACHE_TTL_SECONDS, progress_cache_key
+from app.utils.cache import get_cache
 
 
 DEFAULT_ACHIEVEMENTS = [
@@ -64,7 +66,17 @@ class AchievementService:
         return result.scalars().all()
 
     async def get_user_achievements(self, user_id: int) -> List[dict]:
-        """Get all achievements with user unlock status."""
+        """Get all achievements with user unlock status (cached)."""
+        cache = get_cache()
+        key = progress_cache_key("achievements", user_id)
+        achievements = await cache.get(key)
+        if achievements is None:
+            achievements = await self._load_user_achievements(user_id)
+            await cache.set(key, achievements, ttl=PROGRESS_CACHE_TTL_SECONDS)
+        return achievements
+
+    async def _load_user_achievements(self, user_id: int) -> List[dict]:
+        """Get all achievements with user unlock status without caching."""
         await self.seed_achievements()
         achievements = await self.get_all_achievements()
         result = await self.db.execute(
@@ -116,11 +128,10 @@ class AchievementService:
             # Create notifications for unlocked achievements
             from app.services.notification_service import NotificationService
             notification_service = NotificationService(self.db)
-            for achievement in newly_unlocked:
-                await notification_service.create_achievement_notification(
-                    user_id=user_id,
-                    achievement_name=achievement.name
-                )
+            await notification_service.create_achievement_notifications(
+                user_id=user_id,
+                achievement_names=[achievement.name for achievement in newly_unlocked],
+            )
         return newly_unlocked
 
     async def _get_user_stats(self, user_id: int) -> dict:
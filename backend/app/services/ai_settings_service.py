@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 from cryptography.fernet import Fernet, InvalidToken
-from sqlalchemy import func, select, update
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -176,7 +176,7 @@ class AISettingsService:
         from app.llm.factory import LLMFactory, LLMServiceError
 
         try:
-            models = LLMFactory.list_models(provider_type, api_key)
+            models = await LLMFactory.list_models(provider_type, api_key)
             return {
                 "success": True,
                 "message": f"Connected successfully. Found {len(models)} models.",
@@ -223,33 +223,21 @@ class AISettingsService:
         """Get usage statistics for a provider."""
         since = datetime.utcnow() - timedelta(days=days)
 
-        # Total requests
-        total_result = await self.db.execute(
-            select(func.count(AIUsageLog.id)).where(
-                AIUsageLog.provider_id == provider_id,
-                AIUsageLog.created_at >= since,
-            )
-        )
-        total = total_result.scalar() or 0
-
-        # Successful requests
-        success_result = await self.db.execute(
-            select(func.count(AIUsageLog.id)).where(
-                AIUsageLog.provider_id == provider_id,
-                AIUsageLog.created_at >= since,
-                AIUsageLog.success == True,
-            )
-        )
-        successful = success_result.scalar() or 0
-
-        # Total tokens
-        tokens_result = await self.db.execute(
-            select(func.sum(AIUsageLog.tokens_used)).where(
+        # Single aggregate query for requests, successes and tokens
+        result = await self.db.execute(
+            select(
+                func.count(AIUsageLog.id),
+                func.sum(case((AIUsageLog.success == True, 1), else_=0)),
+                func.sum(AIUsageLog.tokens_used),
+            ).where(
                 AIUsageLog.provider_id == provider_id,
                 AIUsageLog.created_at >= since,
             )
         )
-        total_tokens = tokens_result.scalar() or 0
+        total, successful, total_tokens = result.one()
+        total = total or 0
+        successful = successful or 0
+        total_tokens = total_tokens or 0
 
         return {
             "total_requests": total,
@@ -2,7 +2,8 @@
 
 import json
 import random
-from typing import List, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional
 
 from sqlalchemy import Integer, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,96 +26,102 @@ class GameQuestionService:
         existing_words = set()
         for q in questions:
             try:
-                data = json.loads(q.question_json)
                 # Different game types may use different key names for the main word/sentence
-                if "word" in data:
-                    existing_words.add(data["word"].lower())
-                elif "sentence" in data:
-                    existing_words.add(data["sentence"].lower()[:100])  # Use first 100 chars
-                elif "originalSentence" in data:
-                    existing_words.add(data["originalSentence"].lower()[:100])
-                elif "title" in data:  # speed_reading articles
-                    existing_words.add(data["title"].lower())
+                key = self._dedup_key(json.loads(q.question_json))
+                if key is not None:
+                    existing_words.add(key)
             except (json.JSONDecodeError, KeyError):
                 pass
 
         return existing_words
 
-    async def generate_questions(
+    @staticmethod
+    def _dedup_key(question: dict) -> Optional[str]:
+        """Get the key used to detect duplicate questions for any game type."""
+        if "word" in question:
+            return question["word"].lower()
+        elif "sentence" in question:
+            return question["sentence"].lower()[:100]
+        elif "originalSentence" in question:
+            return question["originalSentence"].lower()[:100]
+        elif "title" in question:  # speed_reading articles
+            return question["title"].lower()
+        return None
+
+    async def stream_questions(
         self, game_type: str, count: int = 5, difficulty: str = "medium"
-    ) -> List[dict]:
+    ) -> AsyncIterator[dict]:
         """
-        Generate new questions using AI and save to database.
-        Skips duplicate questions based on the main word/sentence.
+        Generate new questions using AI, saving and yielding each one as soon
+        as the LLM produces it. Skips duplicate questions based on the main
+        word/sentence.
 
         Args:
             game_type: Type of game (clarity, transitions, brevity)
             count: Number of questions to generate
             difficulty: Question difficulty level
 
-        Returns:
-            List of generated question dictionaries
+        Yields:
+            Generated question dictionaries including their database ID
         """
         from app.llm.factory import LLMContext
         from app.llm.game_question_agent import GameQuestionAgent
-        
+
         # Get existing words to avoid duplicates
         existing_words = await self.get_existing_words(game_type)
+        saved = 0
 
         # Use LLMContext to get DB-configured LLM with automatic usage logging
         async with LLMContext(self.db, endpoint=f"game_question_{game_type}") as ctx:
             agent = GameQuestionAgent(llm=ctx.llm)
             # Request more questions than needed to account for potential duplicates
             request_count = count + min(len(existing_words), 10)
-            questions = await agent.generate_questions(game_type, request_count, existing_words)
-
-        # Filter out duplicates and limit to requested count
-        saved_questions = []
-        for question in questions:
-            if len(saved_questions) >= count:
-                break
-
-            # Check for duplicate based on game type
-            is_duplicate = False
-            if "word" in question:
-                is_duplicate = question["word"].lower() in existing_words
-            elif "sentence" in question:
-                is_duplicate = question["sentence"].lower()[:100] in existing_words
-            elif "originalSentence" in question:
-                is_duplicate = question["originalSentence"].lower()[:100] in existing_words
-            elif "title" in question:  # speed_reading articles
-                is_duplicate = question["title"].lower() in existing_words
-
-            if is_duplicate:
-                continue
-
-            # Save to database
-            db_question = GameQuestion(
-                game_type=game_type,
-                question_json=json.dumps(question, ensure_ascii=False),
-                difficulty=difficulty,
-                is_reviewed=False,
-            )
-            self.db.add(db_question)
-            saved_questions.append({**question, "id": None})
-
-            # Add to existing words to prevent duplicates within this batch
-            if "word" in question:
-                existing_words.add(question["word"].lower())
-            elif "sentence" in question:
-                existing_words.add(question["sentence"].lower()[:100])
-            elif "originalSentence" in question:
-                existing_words.add(question["originalSentence"].lower()[:100])
-            elif "title" in question:  # speed_reading articles
-                existing_words.add(question["title"].lower())
+
+            questions = agent.stream_questions(game_type, request_count, existing_words)
+            async with aclosing(questions):
+                async for question in questions:
+                    key = self._dedup_key(question)
+                    if key is not None and key in existing_words:
+                        continue
+
+                    # Save to database
+                    db_question = GameQuestion(
+                        game_type=game_type,
+                        question_json=json.dumps(question, ensure_ascii=False),
+                        difficulty=difficulty,
+                        is_reviewed=False,
+                    )
+                    self.db.add(db_question)
+                    await self.db.flush()
+
+                    # Add to existing words to prevent duplicates within this batch
+                    if key is not None:
+                        existing_words.add(key)
+
+                    saved += 1
+                    yield {**question, "id": db_question.id}
+
+                    # Stop consuming the LLM stream once we have enough
+                    if saved >= count:
+                        break
 
         await self.db.commit()
 
-        # Get IDs after commit
-        for i, db_q in enumerate(saved_questions):
-            db_q["id"] = i + 1  # Approximate - actual IDs assigned by DB
+    async def generate_questions(
+        self, game_type: str, count: int = 5, difficulty: str = "medium"
+    ) -> List[dict]:
+        """
+        Generate new questions using AI and save to database.
 
-        return saved_questions
+        Buffered variant of stream_questions().
+
+        Returns:
+            List of generated question dictionaries
+        """
+        return [
+            question
+            async for question in self.stream_questions(game_type, count, difficulty)
+        ]
 
     async def get_questions(
         self,
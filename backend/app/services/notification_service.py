@@ -1,9 +1,45 @@
 """Notification service for managing user notifications."""
 
-from sqlalchemy import select, func, update, delete
+from secrets import token_hex
+from typing import Any, Optional
+
+from sqlalchemy import select, func, insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import after_transaction
 from app.models.notification import Notification
+from app.utils.cache import get_cache
+
+# Unread counts are cached per user, tagged with the user's count generation.
+# Every committed change moves the generation to a fresh token, so a count
+# computed before the change (even one stored after it) is never served.
+UNREAD_COUNT_TTL_SECONDS = 3600
+# Generations outlive every count cached under an earlier one
+UNREAD_GENERATION_TTL_SECONDS = 2 * UNREAD_COUNT_TTL_SECONDS
+
+_STALE_UNREAD_KEY = "notification_unread_stale"
+
+
+def _unread_count_key(user_id: int) -> str:
+    return f"notif:unread:{user_id}"
+
+
+def _unread_generation_key(user_id: int) -> str:
+    return f"notif:unread:gen:{user_id}"
+
+
+async def _get_cached_unread_count(cache: Any, user_id: int) -> tuple[Optional[str], Optional[int]]:
+    """The user's current generation, and the cached count if it belongs to it."""
+    generation = await cache.get(_unread_generation_key(user_id))
+    entry = await cache.get(_unread_count_key(user_id))
+    if entry is not None and entry[0] == generation:
+        return generation, entry[1]
+    return generation, None
+
+
+async def _cache_unread_count(cache: Any, user_id: int, generation: Optional[str], count: int) -> None:
+    """Store a count under the generation read before it was computed."""
+    await cache.set(_unread_count_key(user_id), [generation, count], ttl=UNREAD_COUNT_TTL_SECONDS)
 
 
 class NotificationService:
@@ -12,6 +48,23 @@ class NotificationService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def _invalidate_unread_count(self, *user_ids: int) -> None:
+        """Retire the cached unread counts for these users once the transaction ends."""
+        stale = self.db.info.get(_STALE_UNREAD_KEY)
+        if stale is None:
+            stale = self.db.info[_STALE_UNREAD_KEY] = set()
+            after_transaction(self.db, self._flush_stale_unread_counts)
+        stale.update(user_ids)
+
+    async def _flush_stale_unread_counts(self) -> None:
+        stale = self.db.info.pop(_STALE_UNREAD_KEY, set())
+        cache = get_cache()
+        for user_id in stale:
+            # New generation: counts cached under the old one no longer match
+            await cache.set(
+                _unread_generation_key(user_id), token_hex(8), ttl=UNREAD_GENERATION_TTL_SECONDS
+            )
+
     async def create(
         self,
         user_id: int,
@@ -30,8 +83,25 @@ class NotificationService:
         self.db.add(notification)
         await self.db.flush()
         await self.db.refresh(notification)
+        self._invalidate_unread_count(user_id)
         return notification
 
+    async def create_many(self, rows: list[dict]) -> int:
+        """
+        Create notifications in a single batched INSERT.
+
+        Each row is a dict with user_id, type, title and message.
+        Returns the number of notifications created.
+        """
+        if not rows:
+            return 0
+        await self.db.execute(
+            insert(Notification),
+            [{**row, "is_read": False} for row in rows],
+        )
+        self._invalidate_unread_count(*{row["user_id"] for row in rows})
+        return len(rows)
+
     async def get_user_notifications(
         self,
         user_id: int,
@@ -48,24 +118,75 @@ class NotificationService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def get_unread_count(self, user_id: int) -> int:
-        """Get count of unread notifications for a user."""
-        query = select(func.count(Notification.id)).where(
-            Notification.user_id == user_id,
-            Notification.is_read == False,
+    async def get_notifications_with_unread_count(
+        self, user_id: int, limit: int = 50
+    ) -> tuple[list[Notification], int]:
+        """
+        Get recent notifications and the total unread count in one query.
+
+        The unread count is a window aggregate evaluated before LIMIT, so it
+        covers all of the user's notifications, not just the returned page.
+        """
+        cache = get_cache()
+        # Read before the query, so a change committed meanwhile retires this count
+        generation, _ = await _get_cached_unread_count(cache, user_id)
+
+        unread_total = (
+            func.count(Notification.id).filter(Notification.is_read == False).over()
+        )
+        query = (
+            select(Notification, unread_total)
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc())
+            .limit(limit)
         )
         result = await self.db.execute(query)
-        return result.scalar() or 0
+        rows = result.all()
+
+        notifications = [row[0] for row in rows]
+        unread_count = rows[0][1] if rows else 0
+        await _cache_unread_count(cache, user_id, generation, unread_count)
+        return notifications, unread_count
+
+    async def get_unread_count(self, user_id: int) -> int:
+        """Get count of unread notifications for a user (cached)."""
+        cache = get_cache()
+        generation, count = await _get_cached_unread_count(cache, user_id)
+        if count is None:
+            query = select(func.count(Notification.id)).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
+            result = await self.db.execute(query)
+            count = result.scalar() or 0
+            await _cache_unread_count(cache, user_id, generation, count)
+        return count
 
     async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
         """Mark a single notification as read. Returns True if found."""
+        # Only unread rows are written, so repeat clicks cost no write
         query = (
             update(Notification)
-            .where(Notification.id == notification_id, Notification.user_id == user_id)
+            .where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
             .values(is_read=True)
         )
         result = await self.db.execute(query)
-        return result.rowcount > 0
+        if result.rowcount > 0:
+            self._invalidate_unread_count(user_id)
+            return True
+
+        # Nothing changed: either already read or not this user's notification
+        exists = await self.db.execute(
+            select(Notification.id).where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+            )
+        )
+        return exists.first() is not None
 
     async def mark_all_as_read(self, user_id: int) -> int:
         """Mark all notifications as read for a user. Returns count updated."""
@@ -75,6 +196,8 @@ class NotificationService:
             .values(is_read=True)
         )
         result = await self.db.execute(query)
+        if result.rowcount:
+            self._invalidate_unread_count(user_id)
         return result.rowcount
 
     async def delete_notification(self, notification_id: int, user_id: int) -> bool:
@@ -84,7 +207,10 @@ class NotificationService:
             Notification.user_id == user_id,
         )
         result = await self.db.execute(query)
-        return result.rowcount > 0
+        if result.rowcount == 0:
+            return False
+        self._invalidate_unread_count(user_id)
+        return True
 
     # Helper methods for creating specific notification types
     async def create_achievement_notification(
@@ -98,6 +224,20 @@ class NotificationService:
             message=f"You've earned the '{achievement_name}' achievement!",
         )
 
+    async def create_achievement_notifications(
+        self, user_id: int, achievement_names: list[str]
+    ) -> int:
+        """Create notifications for several achievement unlocks at once."""
+        return await self.create_many([
+            {
+                "user_id": user_id,
+                "type": "achievement",
+                "title": "Achievement Unlocked!",
+                "message": f"You've earned the '{name}' achievement!",
+            }
+            for name in achievement_names
+        ])
+
     async def create_streak_notification(
         self, user_id: int, streak_days: int
     ) -> Notification:
@@ -160,14 +300,7 @@ class NotificationService:
             result = await self.db.execute(select(User.id))
             user_ids = [row[0] for row in result.all()]
         
-        count = 0
-        for user_id in user_ids:
-            await self.create(
-                user_id=user_id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-            )
-            count += 1
-        
-        return count
+        return await self.create_many([
+            {"user_id": user_id, "type": notification_type, "title": title, "message": message}
+            for user_id in user_ids
+        ])
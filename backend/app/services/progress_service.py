@@ -6,7 +6,25 @@ from typing import List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import after_transaction
 from app.models.progress import UserProgress, UserStreak
+from app.utils.cache import get_cache
+
+# Dashboard reads (stats, streak, achievements) are cached per user and only
+# change when an activity is recorded, which drops them after commit
+PROGRESS_CACHE_TTL_SECONDS = 60
+
+PROGRESS_CACHE_KINDS = ("stats", "streak", "achievements")
+
+
+def progress_cache_key(kind: str, user_id: int) -> str:
+    return f"progress:{kind}:{user_id}"
+
+
+def invalidate_progress_cache(db: AsyncSession, user_id: int) -> None:
+    """Drop a user's cached dashboard reads once the transaction ends."""
+    keys = [progress_cache_key(kind, user_id) for kind in PROGRESS_CACHE_KINDS]
+    after_transaction(db, lambda: get_cache().delete(*keys))
 
 
 class ProgressService:
@@ -64,8 +82,8 @@ class ProgressService:
         xp: int = 0,
         words_learned: int = 0,
         time_spent_minutes: int = 0,
-    ) -> UserProgress:
-        """Record a learning activity and update progress."""
+    ) -> tuple[UserProgress, UserStreak]:
+        """Record a learning activity and update progress and streak."""
         # Update daily progress
         progress = await self.get_or_create_today_progress(user_id)
         progress.xp_earned += xp
@@ -74,11 +92,12 @@ class ProgressService:
         progress.activities_completed += 1
 
         # Update streak
-        await self._update_streak(user_id)
+        streak = await self._update_streak(user_id)
 
         await self.db.flush()
         await self.db.refresh(progress)
-        return progress
+        invalidate_progress_cache(self.db, user_id)
+        return progress, streak
 
     async def _update_streak(self, user_id: int) -> UserStreak:
         """Update user streak based on activity."""
@@ -102,12 +121,21 @@ class ProgressService:
             streak.current_streak = 1
 
         streak.last_activity_date = today
-        await self.db.flush()
-        await self.db.refresh(streak)
+        # Flushed by record_activity together with the progress row
         return streak
 
     async def get_streak_data(self, user_id: int) -> dict:
-        """Get streak data including 28-day history."""
+        """Get streak data including 28-day history (cached)."""
+        cache = get_cache()
+        key = progress_cache_key("streak", user_id)
+        data = await cache.get(key)
+        if data is None:
+            data = await self._load_streak_data(user_id)
+            await cache.set(key, data, ttl=PROGRESS_CACHE_TTL_SECONDS)
+        return data
+
+    async def _load_streak_data(self, user_id: int) -> dict:
+        """Get streak data without caching."""
         streak = await self.get_or_create_streak(user_id)
         history = await self._get_streak_history(user_id, days=28)
         total_days_active = await self._count_active_days(user_id)
@@ -229,7 +257,17 @@ class ProgressService:
         }
 
     async def get_learning_stats(self, user_id: int) -> dict:
-        """Get comprehensive learning statistics."""
+        """Get comprehensive learning statistics (cached)."""
+        cache = get_cache()
+        key = progress_cache_key("stats", user_id)
+        stats = await cache.get(key)
+        if stats is None:
+            stats = await self._load_learning_stats(user_id)
+            await cache.set(key, stats, ttl=PROGRESS_CACHE_TTL_SECONDS)
+        return stats
+
+    async def _load_learning_stats(self, user_id: int) -> dict:
+        """Get comprehensive learning statistics without caching."""
         streak = await self.get_or_create_streak(user_id)
 
         # Aggregate stats from all progress records
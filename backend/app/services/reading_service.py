@@ -1,11 +1,21 @@
 """Reading article service."""
 
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.reading import ReadingArticle
+from app.utils.cache import get_cache
+
+# AI analyses are also kept in the shared cache so repeat requests skip the DB
+ANALYSIS_CACHE_TTL_SECONDS = 86400
+
+
+def _analysis_cache_key(article_id: int, user_id: int) -> str:
+    # Scoped to the owner: only their requests can have populated it
+    return f"article:{article_id}:analysis:{user_id}"
 
 
 class ReadingService:
@@ -56,26 +66,33 @@ class ReadingService:
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0,
-    ) -> tuple[list[ReadingArticle], int]:
-        """Get user's articles with pagination."""
-        # Get total count
-        count_stmt = select(ReadingArticle).where(ReadingArticle.user_id == user_id)
-        count_result = await self.db.execute(count_stmt)
-        total = len(count_result.scalars().all())
-
-        # Get paginated articles
-        stmt = (
-            select(ReadingArticle)
-            .where(ReadingArticle.user_id == user_id)
-            .order_by(ReadingArticle.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[list[ReadingArticle], bool]:
+        """
+        Get user's articles, newest first, with keyset pagination.
+
+        Args:
+            user_id: User's ID
+            limit: Page size
+            after: (created_at, id) of the last article on the previous page
+
+        Returns:
+            Tuple of (articles, has_more)
+        """
+        # Seek past the previous page instead of OFFSET, so deep pages stay an
+        # index range scan on (user_id, created_at, id)
+        stmt = select(ReadingArticle).where(ReadingArticle.user_id == user_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(ReadingArticle.created_at, ReadingArticle.id) < after)
+        stmt = stmt.order_by(
+            ReadingArticle.created_at.desc(), ReadingArticle.id.desc()
+        ).limit(limit + 1)
         result = await self.db.execute(stmt)
         articles = list(result.scalars().all())
 
-        return articles, total
+        # The extra row only signals another page; no COUNT(*) needed
+        has_more = len(articles) > limit
+        return articles[:limit], has_more
 
     async def get_article(
         self, article_id: int, user_id: int
@@ -102,12 +119,19 @@ class ReadingService:
 
         if title:
             article.title = title
+        content_changed = bool(content) and content != article.content
         if content:
             article.content = content
             article.word_count = len(content.split())
+        if content_changed:
+            # The stored analysis describes the old text
+            article.ai_analysis_json = None
 
+        # Column defaults are Python-side, so the flush has already filled in
+        # updated_at and the row needs no re-read after commit
         await self.db.commit()
-        await self.db.refresh(article)
+        if content_changed:
+            await get_cache().delete(_analysis_cache_key(article_id, user_id))
         return article
 
     async def delete_article(self, article_id: int, user_id: int) -> bool:
@@ -118,4 +142,26 @@ class ReadingService:
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
-        return result.rowcount > 0
+        if not result.rowcount:
+            return False
+        await get_cache().delete(_analysis_cache_key(article_id, user_id))
+        return True
+
+    async def save_analysis(self, article_id: int, user_id: int, analysis_json: str) -> None:
+        """Persist an article's AI analysis without loading the row."""
+        await self.db.execute(
+            update(ReadingArticle)
+            .where(ReadingArticle.id == article_id, ReadingArticle.user_id == user_id)
+            .values(ai_analysis_json=analysis_json)
+        )
+        await self.db.commit()
+
+    async def get_cached_analysis(self, article_id: int, user_id: int) -> Optional[dict]:
+        """Get an article's AI analysis from the shared cache, if present."""
+        return await get_cache().get(_analysis_cache_key(article_id, user_id))
+
+    async def cache_analysis(self, article_id: int, user_id: int, analysis: dict) -> None:
+        """Store an article's AI analysis in the shared cache."""
+        await get_cache().set(
+            _analysis_cache_key(article_id, user_id), analysis, ttl=ANALYSIS_CACHE_TTL_SECONDS
+        )
@@ -1,16 +1,23 @@
 """Spaced Repetition Service using FSRS algorithm."""
 
-import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fsrs import Card, Rating, Scheduler
-from sqlalchemy import and_, select
+from sqlalchemy import Date, and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.user_wordlist import UserWordlist
 from app.models.vocabulary_cache import VocabularyCache
+from app.services.wordlist_service import invalidate_practice_pool, practice_pool_changed
+
+
+# The scheduler only holds its parameters, so one instance serves every request
+_scheduler = Scheduler(
+    desired_retention=0.9,  # 90% target retention rate
+    maximum_interval=365,   # Max 1 year interval
+)
 
 
 class SpacedRepetitionService:
@@ -18,10 +25,7 @@ class SpacedRepetitionService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.scheduler = Scheduler(
-            desired_retention=0.9,  # 90% target retention rate
-            maximum_interval=365,   # Max 1 year interval
-        )
+        self.scheduler = _scheduler
 
     async def get_due_words(self, user_id: int, limit: int = 20) -> list[dict]:
         """
@@ -55,7 +59,7 @@ class SpacedRepetitionService:
 
         words = []
         for entry in entries:
-            definition_data = json.loads(entry.vocabulary.definition_json)
+            definition_data = entry.vocabulary.definition_json
             words.append({
                 "id": entry.id,
                 "word": entry.vocabulary.word,
@@ -118,10 +122,13 @@ class SpacedRepetitionService:
         entry.review_count += 1
 
         # Update mastery level based on state and stability
+        old_mastery = entry.mastery_level
         entry.mastery_level = self._calculate_mastery(card)
 
         await self.db.commit()
         await self.db.refresh(entry)
+        if practice_pool_changed(old_mastery, entry.mastery_level):
+            await invalidate_practice_pool(user_id)
 
         return {
             "id": entry.id,
@@ -136,12 +143,25 @@ class SpacedRepetitionService:
         """Get SRS statistics for a user."""
         now = datetime.now(timezone.utc)
 
-        # Get all wordlist entries
-        stmt = select(UserWordlist).where(UserWordlist.user_id == user_id)
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        # All counts in one aggregate pass instead of loading every entry
+        stmt = select(
+            func.count(UserWordlist.id).label("total"),
+            count_where(
+                or_(UserWordlist.fsrs_card_json.is_(None), UserWordlist.fsrs_card_json == "")
+            ).label("new"),
+            count_where(UserWordlist.fsrs_due <= now).label("due"),
+            count_where(UserWordlist.fsrs_state == "Learning").label("learning"),
+            count_where(UserWordlist.fsrs_state == "Review").label("review"),
+            count_where(UserWordlist.fsrs_state == "Relearning").label("relearning"),
+            func.avg(UserWordlist.mastery_level).label("avg_mastery"),
+        ).where(UserWordlist.user_id == user_id)
         result = await self.db.execute(stmt)
-        entries = result.scalars().all()
+        row = result.one()
 
-        total = len(entries)
+        total = row.total
         if total == 0:
             return {
                 "totalCards": 0,
@@ -153,26 +173,16 @@ class SpacedRepetitionService:
                 "averageRetention": 0.0,
             }
 
-        # Count by state
-        new_count = sum(1 for e in entries if not e.fsrs_card_json)
-        due_count = sum(
-            1 for e in entries
-            if e.fsrs_due and e.fsrs_due <= now
-        )
-        learning = sum(1 for e in entries if e.fsrs_state == "Learning")
-        review = sum(1 for e in entries if e.fsrs_state == "Review")
-        relearning = sum(1 for e in entries if e.fsrs_state == "Relearning")
-
         # Calculate average retention (based on mastery levels)
-        avg_mastery = sum(e.mastery_level for e in entries) / total if total > 0 else 0
+        avg_mastery = float(row.avg_mastery or 0)
 
         return {
             "totalCards": total,
-            "dueToday": due_count + new_count,  # Include new cards as "due"
-            "newCards": new_count,
-            "learningCards": learning,
-            "reviewCards": review,
-            "relearningCards": relearning,
+            "dueToday": row.due + row.new,  # Include new cards as "due"
+            "newCards": row.new,
+            "learningCards": row.learning,
+            "reviewCards": row.review,
+            "relearningCards": row.relearning,
             "averageRetention": round(avg_mastery / 100, 2),  # Convert to 0-1 scale
         }
 
@@ -180,29 +190,31 @@ class SpacedRepetitionService:
         """Get review forecast for the next N days."""
         now = datetime.now(timezone.utc)
 
-        stmt = select(UserWordlist).where(
-            and_(
+        # fsrs_due is stored as naive UTC
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+        end = today + timedelta(days=days)
+
+        # One grouped count over the window (served by the user_id/fsrs_due index)
+        due_day = func.date(UserWordlist.fsrs_due, type_=Date)
+        stmt = (
+            select(due_day, func.count(UserWordlist.id))
+            .where(
                 UserWordlist.user_id == user_id,
-                UserWordlist.fsrs_due.isnot(None),
+                UserWordlist.fsrs_due >= today,
+                UserWordlist.fsrs_due < end,
             )
+            .group_by(due_day)
         )
         result = await self.db.execute(stmt)
-        entries = result.scalars().all()
+        counts = dict(result.all())
 
-        # Count due cards per day
+        # Fill in days with nothing due
         forecast = []
         for i in range(days):
-            day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_start = day_start.replace(day=day_start.day + i)
-            day_end = day_start.replace(day=day_start.day + 1)
-
-            count = sum(
-                1 for e in entries
-                if e.fsrs_due and day_start <= e.fsrs_due < day_end
-            )
+            day = (today + timedelta(days=i)).date()
             forecast.append({
-                "date": day_start.date().isoformat(),
-                "count": count,
+                "date": day.isoformat(),
+                "count": counts.get(day, 0),
             })
 
         return forecast
@@ -4,13 +4,18 @@ TTS Service using Piper
 Provides text-to-speech synthesis using Piper TTS engine.
 """
 
+import asyncio
 import hashlib
 import io
+import os
+import unicodedata
 import wave
 from pathlib import Path
 from typing import Optional
 import logging
 
+from app.utils.cache import get_cache
+
 logger = logging.getLogger(__name__)
 
 # Piper imports - will be available after piper-tts is installed
@@ -21,6 +26,20 @@ except ImportError:
     PIPER_AVAILABLE = False
     logger.warning("Piper TTS not available. Install with: pip install piper-tts")
 
+# Audio files kept in the on-disk cache; least recently used ones are pruned
+TTS_CACHE_MAX_FILES = 5000
+TTS_CACHE_PRUNE_EVERY = 100
+# Phonemes for a given text and voice never change
+PHONEME_CACHE_TTL_SECONDS = 30 * 86400
+
+
+def normalize_tts_text(text: str) -> str:
+    """Canonical form of text for synthesis and cache keys.
+
+    Case is kept: respellings like "ka-SHAY" use capitals to mark stress.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
 
 class TTSService:
     """Text-to-Speech service using Piper."""
@@ -42,6 +61,7 @@ class TTSService:
         self.model_name = model_name or self.DEFAULT_MODEL_NAME
         self.enable_cache = enable_cache
         self.voice: Optional["PiperVoice"] = None
+        self._saves_since_prune = 0
         
         # Ensure cache directory exists
         if self.enable_cache:
@@ -82,9 +102,9 @@ class TTSService:
             return False
     
     def _get_cache_key(self, text: str) -> str:
-        """Generate cache key from text."""
+        """Generate cache key from normalized text."""
         content = f"{text}:{self.model_name}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
     
     def _get_cached_audio(self, cache_key: str) -> Optional[bytes]:
         """Get cached audio if available."""
@@ -92,9 +112,13 @@ class TTSService:
             return None
         
         cache_path = self.CACHE_DIR / f"{cache_key}.wav"
-        if cache_path.exists():
-            return cache_path.read_bytes()
-        return None
+        try:
+            audio_data = cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Mark as recently used for pruning
+        os.utime(cache_path)
+        return audio_data
     
     def _save_to_cache(self, cache_key: str, audio_data: bytes) -> None:
         """Save audio to cache."""
@@ -103,6 +127,29 @@ class TTSService:
         
         cache_path = self.CACHE_DIR / f"{cache_key}.wav"
         cache_path.write_bytes(audio_data)
+
+        self._saves_since_prune += 1
+        if self._saves_since_prune >= TTS_CACHE_PRUNE_EVERY:
+            self._saves_since_prune = 0
+            self._prune_cache()
+    
+    def _prune_cache(self) -> None:
+        """Delete the least recently used audio files beyond TTS_CACHE_MAX_FILES."""
+        entries = []
+        for entry in os.scandir(self.CACHE_DIR):
+            if entry.name.endswith(".wav"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    continue
+        if len(entries) <= TTS_CACHE_MAX_FILES:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - TTS_CACHE_MAX_FILES]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
     
     def synthesize(self, text: str) -> Optional[bytes]:
         """
@@ -116,7 +163,8 @@ class TTSService:
         Returns:
             WAV audio data as bytes, or None if synthesis fails
         """
-        if not text.strip():
+        text = normalize_tts_text(text)
+        if not text:
             return None
         
         # Check cache
@@ -148,6 +196,11 @@ class TTSService:
             logger.error(f"Synthesis failed: {e}")
             return None
     
+    def synthesize_batch(self, texts: list[str]) -> list[Optional[bytes]]:
+        """Synthesize several texts in one call; repeated texts are synthesized once."""
+        audio = {text: self.synthesize(text) for text in dict.fromkeys(texts)}
+        return [audio[text] for text in texts]
+    
     def is_available(self) -> bool:
         """Check if TTS service is available."""
         if not PIPER_AVAILABLE:
@@ -204,3 +257,70 @@ def get_tts_service() -> TTSService:
         _tts_service = TTSService()
     return _tts_service
 
+
+# Piper inference is CPU-bound and blocking, so requests are queued for one
+# background worker. It takes whatever has queued up (up to TTS_BATCH_SIZE)
+# and synthesizes the batch in a worker thread, keeping the event loop free.
+TTS_BATCH_SIZE = 8
+
+_tts_queue: Optional[asyncio.Queue] = None
+_tts_worker: Optional[asyncio.Task] = None
+
+
+async def _run_tts_worker(queue: asyncio.Queue) -> None:
+    tts = get_tts_service()
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < TTS_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            results = await asyncio.to_thread(tts.synthesize_batch, [text for text, _ in batch])
+        except Exception as e:
+            logger.error(f"TTS batch failed: {e}")
+            results = [None] * len(batch)
+
+        for (_, future), audio in zip(batch, results):
+            # Callers that went away have cancelled their future
+            if not future.done():
+                future.set_result(audio)
+
+
+async def synthesize_async(text: str) -> Optional[bytes]:
+    """Synthesize speech via the background worker without blocking the event loop."""
+    global _tts_queue, _tts_worker
+    if _tts_worker is None:
+        _tts_queue = asyncio.Queue()
+        _tts_worker = asyncio.get_running_loop().create_task(_run_tts_worker(_tts_queue))
+
+    future = asyncio.get_running_loop().create_future()
+    await _tts_queue.put((normalize_tts_text(text), future))
+    return await future
+
+
+async def phonemize_cached(text: str) -> str:
+    """Phonemize text, reusing results from the shared cache."""
+    tts = get_tts_service()
+    text = normalize_tts_text(text)
+    cache = get_cache()
+    key = f"tts:phn:{tts._get_cache_key(text)}"
+    phonemes = await cache.get(key)
+    if phonemes is None:
+        phonemes = tts.phonemize(text)
+        if phonemes:
+            await cache.set(key, phonemes, ttl=PHONEME_CACHE_TTL_SECONDS)
+    return phonemes
+
+
+async def close_tts_worker() -> None:
+    """Stop the background synthesis worker."""
+    global _tts_queue, _tts_worker
+    if _tts_worker is not None:
+        _tts_worker.cancel()
+        try:
+            await _tts_worker
+        except asyncio.CancelledError:
+            pass
+    _tts_queue = None
+    _tts_worker = None
+
@@ -1,15 +1,37 @@
 """URL content extraction service."""
 
+import hashlib
 import re
 import logging
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlunparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+from app.utils.cache import get_cache
+
 logger = logging.getLogger(__name__)
 
+# Extracted pages are public content, so they are shared across users
+EXTRACTION_CACHE_TTL_SECONDS = 86400
+
+EXTRACTOR_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def _extraction_cache_key(url: str) -> str:
+    """Cache key for a URL, ignoring scheme/host case and the fragment."""
+    parsed = urlparse(url)
+    normalized = urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        parsed.query,
+        "",
+    ))
+    return "url:" + hashlib.sha256(normalized.encode()).hexdigest()
+
 
 class UrlExtractorService:
     """Service for extracting article content from URLs."""
@@ -51,8 +73,11 @@ class UrlExtractorService:
     ]
 
     def __init__(self):
+        # One client per process (see get_url_extractor), so connections to
+        # frequently imported sites stay alive between requests
         self.client = httpx.AsyncClient(
             timeout=20.0,
+            limits=EXTRACTOR_HTTP_LIMITS,
             follow_redirects=True,
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -75,6 +100,8 @@ class UrlExtractorService:
     async def extract_from_url(self, url: str) -> dict:
         """
         Extract article content from a URL.
+
+        Successful extractions are cached per normalized URL for a day.
         
         Returns:
             dict: Contains 'title', 'content', 'source_url', and 'word_count'
@@ -84,6 +111,12 @@ class UrlExtractorService:
         if not parsed.scheme or not parsed.netloc:
             raise ValueError("Invalid URL format")
 
+        cache = get_cache()
+        cache_key = _extraction_cache_key(url)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "source_url": url}
+
         try:
             response = await self.client.get(url)
             response.raise_for_status()
@@ -118,12 +151,14 @@ class UrlExtractorService:
 
         word_count = len(content.split())
 
-        return {
+        result = {
             "title": title,
             "content": content,
             "source_url": url,
             "word_count": word_count,
         }
+        await cache.set(cache_key, result, ttl=EXTRACTION_CACHE_TTL_SECONDS)
+        return result
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title."""
@@ -190,3 +225,11 @@ def get_url_extractor() -> UrlExtractorService:
     if _extractor is None:
         _extractor = UrlExtractorService()
     return _extractor
+
+
+async def close_url_extractor() -> None:
+    """Close the URL extractor's HTTP client, if one was created."""
+    global _extractor
+    if _extractor is not None:
+        await _extractor.close()
+        _extractor = None
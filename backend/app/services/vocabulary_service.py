@@ -1,12 +1,130 @@
 """Vocabulary caching service."""
 
-import json
-from typing import Optional, Tuple
-
-from sqlalchemy import select
+import asyncio
+import hashlib
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+import orjson
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import async_session_maker
+from app.llm.factory import LLMContext
+from app.llm.vocabulary_agent import VocabularyAgent
 from app.models.vocabulary_cache import VocabularyCache
+from app.utils.cache import TTLCache, get_cache
+
+# Definitions never change once stored, so lookups are served from a small
+# in-process cache (L1), then the shared cache (L2), before the database.
+# L1 entries are (definition, etag) so cache hits can be revalidated for free.
+VOCAB_CACHE_TTL_SECONDS = 86400
+
+_local_definitions = TTLCache(maxsize=512, ttl=VOCAB_CACHE_TTL_SECONDS)
+
+logger = logging.getLogger(__name__)
+
+# Cache hits are tallied in memory and written as one batched UPDATE per
+# interval, so the hot cache-hit path does no database writes of its own.
+LOOKUP_FLUSH_INTERVAL_SECONDS = 1.0
+
+_pending_lookups: Counter[str] = Counter()
+_flush_task: Optional[asyncio.Task] = None
+
+_vocab_table = VocabularyCache.__table__
+_INCREMENT_LOOKUPS_STMT = (
+    update(_vocab_table)
+    .where(_vocab_table.c.word == bindparam("w"))
+    .values(lookup_count=_vocab_table.c.lookup_count + bindparam("n"))
+)
+
+
+# AI lookups in progress, keyed by normalized word. Concurrent misses for the
+# same word await the first request's result instead of calling the LLM again.
+_INFLIGHT: dict[str, asyncio.Future] = {}
+
+
+def _vocab_cache_key(word: str) -> str:
+    return f"vocab:{word}"
+
+
+def definition_etag(definition: dict) -> str:
+    """Strong ETag for a stored definition."""
+    digest = hashlib.blake2b(orjson.dumps(definition, option=orjson.OPT_SORT_KEYS), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def cached_definition_etag(word: str) -> Optional[str]:
+    """ETag of a definition held in the in-process cache, or None."""
+    entry = _local_definitions.get(word)
+    return entry[1] if entry is not None else None
+
+
+async def await_inflight_lookup(word: str) -> Optional[dict]:
+    """Wait for another request's AI lookup of word, or None if there is none."""
+    future = _INFLIGHT.get(word)
+    if future is None:
+        return None
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # The leading request gave up without a result; look it up ourselves
+        if future.cancelled():
+            return None
+        raise
+
+
+async def flush_lookup_counts() -> None:
+    """Write the pending cache-hit counts in one executemany UPDATE."""
+    if not _pending_lookups:
+        return
+    params = [{"w": word, "n": count} for word, count in _pending_lookups.items()]
+    _pending_lookups.clear()
+    try:
+        async with async_session_maker() as session:
+            await session.execute(_INCREMENT_LOOKUPS_STMT, params)
+            await session.commit()
+    except Exception:
+        # Lookup counts are statistics; losing one batch is not worth failing over
+        logger.exception("Failed to write %d vocabulary lookup counts", len(params))
+
+
+async def _flush_lookups_later() -> None:
+    global _flush_task
+    try:
+        await asyncio.sleep(LOOKUP_FLUSH_INTERVAL_SECONDS)
+    finally:
+        _flush_task = None
+    await flush_lookup_counts()
+
+
+async def close_lookup_counter() -> None:
+    """Cancel the scheduled flush and write what is pending (for shutdown)."""
+    if _flush_task is not None:
+        _flush_task.cancel()
+    await flush_lookup_counts()
+
+
+@contextmanager
+def inflight_lookup(word: str) -> Iterator[asyncio.Future]:
+    """Register the caller as the AI lookup for word; set_result() shares it."""
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[word] = future
+    try:
+        yield future
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody waited on is not logged
+            future.exception()
+        raise
+    finally:
+        if not future.done():
+            future.cancel()
+        if _INFLIGHT.get(word) is future:
+            del _INFLIGHT[word]
 
 
 class VocabularyService:
@@ -29,32 +147,60 @@ class VocabularyService:
         normalized_word = word.strip().lower()
 
         # Try cache first
-        cached = await self._get_cached(normalized_word)
-        if cached:
-            # Increment lookup count
-            cached.lookup_count += 1
-            await self.db.commit()
-            return json.loads(cached.definition_json), "cache"
+        cached = await self.get_definition(normalized_word)
+        if cached is not None:
+            self.record_lookup(normalized_word)
+            return cached, "cache"
+
+        # Another request may already be asking the AI for this word
+        shared = await await_inflight_lookup(normalized_word)
+        if shared is not None:
+            return shared, "ai"
 
         # Cache miss - call AI
-        from app.llm.vocabulary_agent import VocabularyAgent
-        
-        if custom_llm:
-            # Use user-provided LLM (BYOK - no usage logging)
-            agent = VocabularyAgent(llm=custom_llm)
-            result = await agent.lookup_word(normalized_word)
-        else:
-            # Use DB-configured provider with usage logging
-            from app.llm.factory import LLMContext
-            async with LLMContext(self.db, endpoint="vocabulary_lookup") as ctx:
-                agent = VocabularyAgent(llm=ctx.llm)
+        with inflight_lookup(normalized_word) as lookup:
+            if custom_llm:
+                # Use user-provided LLM (BYOK - no usage logging)
+                agent = VocabularyAgent(llm=custom_llm)
                 result = await agent.lookup_word(normalized_word)
-
-        # Save to cache
-        await self._save_to_cache(normalized_word, result)
+            else:
+                # Use DB-configured provider with usage logging
+                async with LLMContext(self.db, endpoint="vocabulary_lookup") as ctx:
+                    agent = VocabularyAgent(llm=ctx.llm)
+                    result = await agent.lookup_word(normalized_word)
+            # Waiters are released only once the row is committed, so they
+            # (and later requests) can rely on the cache entry existing
+            await self._save_to_cache(normalized_word, result)
+            lookup.set_result(result)
 
         return result, "ai"
 
+    async def get_definition(self, word: str) -> Optional[dict]:
+        """Get a stored definition through the L1/L2 caches, or None if not stored."""
+        entry = _local_definitions.get(word)
+        if entry is not None:
+            return entry[0]
+
+        cache = get_cache()
+        key = _vocab_cache_key(word)
+        definition = await cache.get(key)
+        if definition is None:
+            cached = await self._get_cached(word)
+            if not cached:
+                return None
+            definition = cached.definition_json
+            await cache.set(key, definition, ttl=VOCAB_CACHE_TTL_SECONDS)
+
+        _local_definitions.set(word, (definition, definition_etag(definition)))
+        return definition
+
+    def record_lookup(self, word: str) -> None:
+        """Count a cache hit; counts are written in batches shortly after."""
+        global _flush_task
+        _pending_lookups[word] += 1
+        if _flush_task is None:
+            _flush_task = asyncio.get_running_loop().create_task(_flush_lookups_later())
+
     async def _get_cached(self, word: str) -> Optional[VocabularyCache]:
         """Get cached word definition if exists."""
         stmt = select(VocabularyCache).where(VocabularyCache.word == word)
@@ -65,12 +211,14 @@ class VocabularyService:
         """Save word definition to cache."""
         cache_entry = VocabularyCache(
             word=word,
-            definition_json=json.dumps(definition, ensure_ascii=False),
+            definition_json=definition,
             lookup_count=1,
         )
         self.db.add(cache_entry)
         await self.db.commit()
         await self.db.refresh(cache_entry)
+        await get_cache().set(_vocab_cache_key(word), definition, ttl=VOCAB_CACHE_TTL_SECONDS)
+        _local_definitions.set(word, (definition, definition_etag(definition)))
         return cache_entry
 
     async def get_cache_stats(self) -> dict:
@@ -1,15 +1,60 @@
 """Wordlist service for managing user's vocabulary list."""
 
-import json
+import random
 from typing import Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, bindparam, case, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.models.user_wordlist import UserWordlist
 from app.models.vocabulary_cache import VocabularyCache
 from app.services.vocabulary_service import VocabularyService
+from app.utils.cache import get_cache
+
+# Conversation practice draws target words from the user's not-yet-mastered
+# entries. That pool is cached per user and dropped whenever it can change.
+PRACTICE_MAX_MASTERY = 70
+PRACTICE_POOL_TTL_SECONDS = 3600
+
+
+def _practice_pool_key(user_id: int) -> str:
+    return f"wl:unmastered:{user_id}"
+
+
+async def invalidate_practice_pool(user_id: int) -> None:
+    """Drop a user's cached practice word pool."""
+    await get_cache().delete(_practice_pool_key(user_id))
+
+
+def practice_pool_changed(old_mastery: int, new_mastery: int) -> bool:
+    """Whether a mastery update moves a word into or out of the practice pool."""
+    return (old_mastery <= PRACTICE_MAX_MASTERY) != (new_mastery <= PRACTICE_MAX_MASTERY)
+
+
+# Hot statements are built once; per-call values are bound at execution.
+# The word list loads each entry's definition in the same query, and any other
+# relationship touched while building the response raises instead of issuing
+# one lazy SELECT per entry.
+_USER_WORDLIST_STMT = (
+    select(UserWordlist)
+    .options(joinedload(UserWordlist.vocabulary), raiseload("*"))
+    .where(UserWordlist.user_id == bindparam("user_id"))
+    .order_by(UserWordlist.added_at.desc())
+)
+
+_ENTRY_STMT = (
+    select(UserWordlist)
+    .options(joinedload(UserWordlist.vocabulary))
+    .join(VocabularyCache)
+    .where(
+        and_(
+            UserWordlist.user_id == bindparam("user_id"),
+            VocabularyCache.word == bindparam("word"),
+        )
+    )
+)
 
 
 class WordlistService:
@@ -25,18 +70,12 @@ class WordlistService:
 
         Returns list of word entries with full definition data.
         """
-        stmt = (
-            select(UserWordlist)
-            .options(joinedload(UserWordlist.vocabulary))
-            .where(UserWordlist.user_id == user_id)
-            .order_by(UserWordlist.added_at.desc())
-        )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_USER_WORDLIST_STMT, {"user_id": user_id})
         entries = result.scalars().all()
 
         words = []
         for entry in entries:
-            definition_data = json.loads(entry.vocabulary.definition_json)
+            definition_data = entry.vocabulary.definition_json
             words.append({
                 "id": entry.id,
                 "word": entry.vocabulary.word,
@@ -81,8 +120,9 @@ class WordlistService:
         self.db.add(entry)
         await self.db.commit()
         await self.db.refresh(entry)
+        await invalidate_practice_pool(user_id)
 
-        definition_data = json.loads(cache_entry.definition_json)
+        definition_data = cache_entry.definition_json
         return {
             "id": entry.id,
             "word": cache_entry.word,
@@ -106,6 +146,7 @@ class WordlistService:
 
         await self.db.delete(entry)
         await self.db.commit()
+        await invalidate_practice_pool(user_id)
         return True
 
     async def update_entry(
@@ -124,13 +165,16 @@ class WordlistService:
 
         if notes is not None:
             entry.notes = notes
+        old_mastery = entry.mastery_level
         if mastery_level is not None:
             entry.mastery_level = max(0, min(100, mastery_level))
 
         await self.db.commit()
         await self.db.refresh(entry)
+        if practice_pool_changed(old_mastery, entry.mastery_level):
+            await invalidate_practice_pool(user_id)
 
-        definition_data = json.loads(entry.vocabulary.definition_json)
+        definition_data = entry.vocabulary.definition_json
         return {
             "id": entry.id,
             "word": entry.vocabulary.word,
@@ -170,19 +214,27 @@ class WordlistService:
         if max_mastery is not None:
             conditions.append(UserWordlist.mastery_level <= max_mastery)
 
-        stmt = (
-            select(UserWordlist)
-            .options(joinedload(UserWordlist.vocabulary))
+        # Draw the random ids from the narrow wordlist rows, then load only
+        # those entries with their definitions, so the random sort never
+        # carries the definition JSON of every candidate row
+        sample_ids = (
+            select(UserWordlist.id)
             .where(and_(*conditions))
             .order_by(func.random())
             .limit(count)
         )
+        stmt = (
+            select(UserWordlist)
+            .options(joinedload(UserWordlist.vocabulary))
+            .where(UserWordlist.id.in_(sample_ids.scalar_subquery()))
+        )
         result = await self.db.execute(stmt)
-        entries = result.scalars().all()
+        entries = list(result.scalars().all())
+        random.shuffle(entries)
 
         words = []
         for entry in entries:
-            definition_data = json.loads(entry.vocabulary.definition_json)
+            definition_data = entry.vocabulary.definition_json
             words.append({
                 "word": entry.vocabulary.word,
                 "definition": definition_data.get("definition", ""),
@@ -192,13 +244,50 @@ class WordlistService:
 
         return words
 
+    async def get_practice_words(self, user_id: int, count: int = 3) -> list[str]:
+        """
+        Pick random not-yet-mastered words for conversation practice.
+
+        The candidate pool is cached, so repeat calls are a random draw in
+        memory rather than an ORDER BY RANDOM() query.
+        """
+        cache = get_cache()
+        key = _practice_pool_key(user_id)
+        pool = await cache.get(key)
+        if pool is None:
+            stmt = (
+                select(VocabularyCache.word)
+                .join(UserWordlist, UserWordlist.vocabulary_cache_id == VocabularyCache.id)
+                .where(
+                    and_(
+                        UserWordlist.user_id == user_id,
+                        UserWordlist.mastery_level <= PRACTICE_MAX_MASTERY,
+                    )
+                )
+            )
+            result = await self.db.execute(stmt)
+            pool = list(result.scalars().all())
+            await cache.set(key, pool, ttl=PRACTICE_POOL_TTL_SECONDS)
+
+        return random.sample(pool, min(count, len(pool)))
+
     async def get_stats(self, user_id: int) -> dict:
         """Get wordlist statistics for user."""
-        stmt = select(UserWordlist).where(UserWordlist.user_id == user_id)
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        # Aggregate in SQL rather than loading every entry with its definition
+        stmt = select(
+            func.count(UserWordlist.id).label("total"),
+            count_where(UserWordlist.mastery_level >= 80).label("mastered"),
+            count_where(UserWordlist.mastery_level.between(20, 79)).label("learning"),
+            count_where(UserWordlist.mastery_level < 20).label("new"),
+            func.avg(UserWordlist.mastery_level).label("avg_mastery"),
+        ).where(UserWordlist.user_id == user_id)
         result = await self.db.execute(stmt)
-        entries = result.scalars().all()
+        row = result.one()
 
-        total = len(entries)
+        total = row.total
         if total == 0:
             return {
                 "total_words": 0,
@@ -208,33 +297,17 @@ class WordlistService:
                 "average_mastery": 0.0,
             }
 
-        mastered = sum(1 for e in entries if e.mastery_level >= 80)
-        learning = sum(1 for e in entries if 20 <= e.mastery_level < 80)
-        new = sum(1 for e in entries if e.mastery_level < 20)
-        avg_mastery = sum(e.mastery_level for e in entries) / total
-
         return {
             "total_words": total,
-            "words_mastered": mastered,
-            "words_learning": learning,
-            "words_new": new,
-            "average_mastery": round(avg_mastery, 1),
+            "words_mastered": row.mastered,
+            "words_learning": row.learning,
+            "words_new": row.new,
+            "average_mastery": round(float(row.avg_mastery), 1),
         }
 
     async def _get_entry(self, user_id: int, word: str) -> Optional[UserWordlist]:
         """Get a specific wordlist entry."""
-        stmt = (
-            select(UserWordlist)
-            .options(joinedload(UserWordlist.vocabulary))
-            .join(VocabularyCache)
-            .where(
-                and_(
-                    UserWordlist.user_id == user_id,
-                    VocabularyCache.word == word,
-                )
-            )
-        )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_ENTRY_STMT, {"user_id": user_id, "word": word})
         return result.scalar_one_or_none()
 
     async def _get_or_create_vocabulary(self, word: str, custom_llm=None) -> VocabularyCache:
@@ -250,6 +323,17 @@ class WordlistService:
         # Lookup via AI and cache
         definition, _ = await self.vocabulary_service.lookup_word(word, custom_llm=custom_llm)
 
-        # The lookup_word already saves to cache, so fetch it
+        # lookup_word normally stores the entry, so fetch it
         result = await self.db.execute(stmt)
-        return result.scalar_one()
+        cache_entry = result.scalar_one_or_none()
+        if cache_entry is not None:
+            return cache_entry
+
+        # Not stored (e.g. the lookup ran in another worker and has not been
+        # saved yet): store it here, unless someone else got there first
+        try:
+            return await self.vocabulary_service._save_to_cache(word, definition)
+        except IntegrityError:
+            await self.db.rollback()
+            result = await self.db.execute(stmt)
+            return result.scalar_one()
@@ -0,0 +1,64 @@
+"""Small in-process TTL memoizer for async functions."""
+
+import asyncio
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from app.utils.cache import TTLCache
+
+
+def async_ttl_cache(
+    ttl: float, key: Optional[Callable[..., Hashable]] = None, maxsize: int = 1024
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the result of an async function for ``ttl`` seconds.
+
+    Concurrent callers with the same key share a single in-flight call.
+    Failed calls are not cached. The wrapped function gains a
+    ``cache_clear()`` method for invalidation after writes.
+
+    Args:
+        ttl: Seconds a result stays fresh
+        key: Optional function mapping the call arguments to a cache key.
+            Use it to leave out unhashable or per-request arguments such as
+            a database session, e.g. ``key=lambda db: ()``.
+        maxsize: Most results kept; the least recently used are dropped first
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, frozenset(kwargs.items()))
+
+            cached = entries.get(cache_key)
+            if cached is not None:
+                if cached.done():
+                    return cached.result()
+                return await asyncio.shield(cached)
+
+            future = asyncio.get_running_loop().create_future()
+            entries.set(cache_key, future)
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as e:
+                if entries.get(cache_key) is future:
+                    entries.pop(cache_key)
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark as retrieved so failures nobody waited on aren't logged
+                    future.exception()
+                raise
+            future.set_result(result)
+            return result
+
+        def cache_clear() -> None:
+            entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
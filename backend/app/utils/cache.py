@@ -0,0 +1,103 @@
+"""Caching helpers.
+
+- TTLCache: bounded, process-local LRU cache with per-entry expiry.
+- MemoryCache / RedisCache: async key-value caches for JSON-serializable
+  values. get_cache() returns the Redis one when REDIS_URL is configured so
+  cached data is shared across workers, and the in-process one otherwise.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import orjson
+
+from app.database import get_redis
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MemoryCache:
+    """Async cache backed by a process-local TTLCache."""
+
+    def __init__(self, maxsize: int = 4096):
+        self._cache = TTLCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+
+class RedisCache:
+    """Async cache storing orjson-encoded values in Redis."""
+
+    def __init__(self, redis: Any):
+        self.redis = redis
+
+    async def get(self, key: str) -> Any:
+        raw = await self.redis.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.redis.set(key, orjson.dumps(value), ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.redis.delete(*keys)
+
+
+_cache: Optional[MemoryCache | RedisCache] = None
+
+
+def get_cache() -> MemoryCache | RedisCache:
+    """Get or create the shared cache instance."""
+    global _cache
+    if _cache is None:
+        redis = get_redis()
+        _cache = RedisCache(redis) if redis is not None else MemoryCache()
+    return _cache
@@ -0,0 +1,10 @@
+"""Server-Sent Events helpers shared by the streaming endpoints."""
+
+import orjson
+
+SSE_DONE = b"data: [DONE]\n\n"
+
+
+def sse_event(payload: dict) -> bytes:
+    """Encode one SSE data event carrying a JSON payload."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
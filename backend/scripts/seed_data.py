@@ -95,9 +95,13 @@ async def seed_vocabulary(session) -> None:
         for item in data:
             word = item["word"]
             if word not in existing_words:
+                definition = item["definition_json"]
+                if isinstance(definition, str):
+                    # Older dumps stored the definition as a JSON string
+                    definition = json.loads(definition)
                 db_item = VocabularyCache(
                     word=word,
-                    definition_json=item["definition_json"],
+                    definition_json=definition,
                     lookup_count=item.get("lookup_count", 1)
                 )
                 session.add(db_item)
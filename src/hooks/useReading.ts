@@ -21,10 +21,10 @@ const ANALYSIS_KEY = ['reading', 'analysis'];
 /**
  * Hook for fetching user's articles list
  */
-export function useArticles(limit = 50, offset = 0) {
+export function useArticles(limit = 50, cursor: string | null = null) {
     return useQuery({
-        queryKey: [...ARTICLES_KEY, limit, offset],
-        queryFn: () => getArticles(limit, offset),
+        queryKey: [...ARTICLES_KEY, limit, cursor],
+        queryFn: () => getArticles(limit, cursor),
     });
 }
 
@@ -26,8 +26,9 @@ export interface ArticleSummary {
 }
 
 export interface ArticleListResponse {
-  total: number;
   articles: ArticleSummary[];
+  has_more: boolean;
+  next_cursor: string | null;
 }
 
 export interface CreateArticleRequest {
@@ -51,8 +52,9 @@ export async function createArticle(data: CreateArticleRequest): Promise<Article
 /**
  * Get user's articles
  */
-export async function getArticles(limit = 50, offset = 0): Promise<ArticleListResponse> {
-  return api.get<ArticleListResponse>(`/api/reading/articles?limit=${limit}&offset=${offset}`);
+export async function getArticles(limit = 50, cursor?: string | null): Promise<ArticleListResponse> {
+  const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+  return api.get<ArticleListResponse>(`/api/reading/articles?limit=${limit}${cursorParam}`);
 }
 
 /**